@@ -1,12 +1,5 @@
-import time
 import PyATEMMax
-
-def on_press(key):
-    if str(key).replace("'","") == '0':
-        print('pressed 0')
-
-listener = Listener(on_press=on_press)
-listener.start()
+from pynput.keyboard import Listener
 
 ATEM_IP = "172.17.0.79"
 INPUT_NUMBER = 3           # HDMI input to switch to (1–4)
@@ -15,33 +8,52 @@ INPUT_NUMBER = 3           # HDMI input to switch to (1–4)
 PRG = 1
 CUE = 1
 
-switcher = PyATEMMax.ATEMMax()
-
-# Connect
-switcher.connect(ATEM_IP)
-switcher.waitForConnection()
+switcher = None
 
-while True:
+def on_press(key):
+    global CUE, PRG
+    k = str(key).replace("'", "")
+    if k in ('1', '2', '3', '4'):
+        CUE = int(k)
+    elif k == '0':
+        print('pressed 0')
+        return
+    else:
+        return
+    # Switch straight from the key event; no polling loop needed
     if CUE != PRG:
         PRG = CUE
         switcher.setProgramInputVideoSource(0, PRG)
-    
-    time.sleep(0.2)
+
+def main():
+    global switcher
+    switcher = PyATEMMax.ATEMMax()
+
+    # Connect
+    switcher.connect(ATEM_IP)
+    switcher.waitForConnection()
+
+    with Listener(on_press=on_press) as listener:
+        listener.join()
+
+if __name__ == "__main__":
+    main()
 
     
 """
 Minimal ATEM program switch controller (prototype)
 
 Description
-- Connects to an ATEM and updates Program when CUE changes.
-- Intended for quick tests; requires pynput's Keyboard Listener (not imported here).
+- Connects to an ATEM and switches Program as soon as a key 1..4 is pressed.
+- Intended for quick tests; uses pynput's Keyboard Listener.
 
 Usage
-- Ensure PyATEMMax is available.
-- Optionally add: from pynput.keyboard import Listener
+- Ensure PyATEMMax and pynput are available.
+- Run as a script; importing the module does not connect.
 - Edit ATEM_IP and INPUT_NUMBER as needed.
 
 Notes
-- This file is a lightweight example and may require fixes for production use
-  (e.g., importing Listener and updating CUE on key events).
+- This file is a lightweight example and may require fixes for production use.
+- The main thread blocks on listener.join(); all switching happens in the
+  Listener callback.
 """
@@ -0,0 +1,30 @@
+"""
+.env parsing shared by run.py and run_mpv.py
+
+Lines are KEY=VALUE with an optional quoted value (which may contain '#')
+and an inline "# comment"; comment-only lines never match. A CRLF line
+ending's \\r is left out of the value.
+"""
+
+import re
+
+ENV_LINE_RE = re.compile(
+    r'^[ \t]*([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*'
+    r'("[^"\r\n]*"|\'[^\'\r\n]*\'|[^#\r\n]*?)[ \t]*(?:#[^\r\n]*)?\r?$',
+    re.MULTILINE,
+)
+
+
+def parse_env_text(text):
+    """Return the KEY=VALUE pairs in text as a dict, with quotes stripped.
+
+    Quoted values unquote the same with LF or CRLF endings: KEY="x"\\r\\n
+    gives x.
+    """
+    values = {}
+    for m in ENV_LINE_RE.finditer(text):
+        key, val = m.group(1), m.group(2)
+        if len(val) >= 2 and val[0] == val[-1] and val[0] in '"\'':
+            val = val[1:-1]
+        values[key] = val
+    return values
@@ -1,34 +1,57 @@
+import select
 import socket
+import struct
+import time
 
 ATEM_IP = "172.17.0.79"
 INPUT_NUMBER = 3           # HDMI input to switch to (1–4)
 ATEM_PORT = 4242
 
-def get_current_program_input(host=ATEM_IP, port=ATEM_PORT, timeout=5):
+# Packet fields read by parse_atem_packet(); extend the format here when
+# more fields are parsed.
+_PRG_OFFSET = 20
+_PRG_STRUCT = struct.Struct("<B")
+
+# Receive buffer size for one ATEM status packet
+_RECV_BUF_SIZE = 2048
+
+def get_current_program_input(host=ATEM_IP, port=ATEM_PORT, timeout=5, stop_event=None):
     """
     Connects to the ATEM UDP status port, waits for one packet,
     parses the program input, returns it.
+
+    Waits in 50 ms select() slices so a caller can cancel early by setting
+    stop_event (a threading.Event); returns None on timeout or cancel.
     """
+    # Per call, so probes running on several threads don't share a buffer
+    buf = bytearray(_RECV_BUF_SIZE)
     sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-    sock.settimeout(timeout)
+    sock.setblocking(False)
     sock.bind(('', port))  # bind to local port to receive ATEM UDP packets
 
+    deadline = time.monotonic() + timeout
     try:
-        data, addr = sock.recvfrom(2048)  # wait for one packet
-    except socket.timeout:
-        print("Timeout waiting for ATEM packet")
-        return None
+        while True:
+            if stop_event is not None and stop_event.is_set():
+                return None
+            r, _, _ = select.select([sock], [], [], 0.05)
+            if r:
+                nbytes, addr = sock.recvfrom_into(buf)  # one packet
+                break
+            if time.monotonic() > deadline:
+                print("Timeout waiting for ATEM packet")
+                return None
     finally:
         sock.close()
 
     # Parse the packet data to extract current program input
-    program_input = parse_atem_packet(data)
+    program_input = parse_atem_packet(memoryview(buf)[:nbytes])
     return program_input
 
 def parse_atem_packet(data):
     # Basic example: guess the program input at byte offset 20 (change if needed)
-    if len(data) > 20:
-        return data[20]
+    if len(data) > _PRG_OFFSET:
+        return _PRG_STRUCT.unpack_from(data, _PRG_OFFSET)[0]
     return None
 
 
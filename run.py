@@ -29,16 +29,36 @@ Dependencies
 - PyATEMMax, pyserial, Tkinter (bundled with Python on most systems).
 """
 
-import tkinter as tk
 import time
 import os
 import sys
 import json
 import platform
-import PyATEMMax
-import serial
-from serial.tools import list_ports
 import threading
+import queue
+import heapq
+import itertools
+import functools
+
+from envfile import parse_env_text
+
+# Heavy modules (Tk, pyserial, PyATEMMax) are imported by
+# _load_runtime_modules() from main(), so importing this module stays cheap.
+tk = None
+PyATEMMax = None
+serial = None
+list_ports = None
+
+
+def _load_runtime_modules():
+    global tk, PyATEMMax, serial, list_ports
+    import tkinter as tk
+    import PyATEMMax
+    import serial
+    from serial.tools import list_ports
+
+
+_ENV_KEYS = ("ATEM_IP", "ARDUINO_PORT", "BAUD_RATE", "KAREL_CONFIG")
 
 
 def _load_env_file():
@@ -50,8 +70,11 @@ def _load_env_file():
        (when running from source): <exec_dir>/.env
 
     Only sets variables that are not already present in os.environ so that
-    real environment variables still take precedence.
+    real environment variables still take precedence. Skipped entirely when
+    every key this script reads is already set.
     """
+    if all(k in os.environ for k in _ENV_KEYS):
+        return
     candidates = []
     # CWD .env
     candidates.append(os.path.join(os.getcwd(), ".env"))
@@ -71,21 +94,10 @@ def _load_env_file():
 
     try:
         with open(env_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                line = line.strip()
-                if not line or line.startswith('#'):
-                    continue
-                # Strip inline comments beginning with ' #' (space hash) or just '#'
-                # when not within quotes. Keep this simple.
-                if '#' in line and not (line.startswith('"') or line.startswith("'")):
-                    line = line.split('#', 1)[0].strip()
-                if '=' not in line:
-                    continue
-                key, val = line.split('=', 1)
-                key = key.strip()
-                val = val.strip().strip('"').strip("'")
-                if key and key not in os.environ:
-                    os.environ[key] = val
+            text = f.read()
+        for key, val in parse_env_text(text).items():
+            if key not in os.environ:
+                os.environ[key] = val
     except Exception as e:
         print(f"Warning: could not read .env file: {e}")
 
@@ -153,36 +165,89 @@ def detect_arduino_port():
 
 
 # Connect to ATEM Mini Pro
-switcher = PyATEMMax.ATEMMax()
-_atem_lock = threading.Lock()
-def _atem_is_connected():
+# PyATEMMax runs its own UDP loop and re-handshakes by itself after a
+# timeout, so the app connects once and then only follows its events.
+# All commands go through the ATEM worker thread (ChannelSwitcherApp.cmd_q).
+switcher = None  # created by _atem_create() from main()
+# Mirror of switcher.connected so UI paths read a plain bool. Kept in sync
+# by PyATEMMax connect/disconnect events.
+_atem_connected = False
+def _atem_set_connected(ok):
+    global _atem_connected
+    _atem_connected = bool(ok)
+def _atem_create():
+    global switcher
+    switcher = PyATEMMax.ATEMMax()
+    switcher.registerEvent(switcher.atem.events.connect, lambda _: _atem_set_connected(True))
+    switcher.registerEvent(switcher.atem.events.disconnect, lambda _: _atem_set_connected(False))
+
+
+def _serial_set_low_latency(port):
+    """Best-effort ASYNC_LOW_LATENCY on Linux USB-serial bridges (FTDI/CH340).
+
+    Without it the kernel's 16 ms latency timer coalesces incoming bytes.
+    Uses pyserial's set_low_latency_mode (pyserial >= 3.5) and falls back to
+    the TIOCGSERIAL/TIOCSSERIAL ioctl for older versions. Errors are ignored;
+    not all drivers or platforms support it.
+    """
     try:
-        return bool(getattr(switcher, "connected", False))
+        port.set_low_latency_mode(True)
+        return True
+    except AttributeError:
+        pass
     except Exception:
         return False
-def _atem_connect_blocking():
     try:
-        with _atem_lock:
-            if _atem_is_connected():
-                return True
-            switcher.connect(ATEM_IP)
-            switcher.waitForConnection()
-            return _atem_is_connected()
-    except Exception as e:
-        print(f"ATEM connect error: {e}")
+        import array
+        import fcntl
+        import termios
+        buf = array.array('i', [0] * 32)
+        fcntl.ioctl(port.fileno(), termios.TIOCGSERIAL, buf)
+        buf[4] |= 0x2000  # flags |= ASYNC_LOW_LATENCY
+        fcntl.ioctl(port.fileno(), termios.TIOCSSERIAL, buf)
+        return True
+    except Exception:
         return False
 
 
 # Connect to Arduino
 ser = None
 _serial_port_name = ARDUINO_PORT  # may be empty -> auto
+# Auto-detected ports are reused across retries; rescan (list_ports walks
+# sysfs) only when the device node is gone or every N failed opens.
+_serial_fail_count = 0
+_SERIAL_RESCAN_EVERY = 10
+def _serial_close(port):
+    """Close a serial port, first waking a reader thread blocked in read().
+
+    Ports are opened without a read timeout, and pyserial's close() alone
+    doesn't interrupt a pending read(); cancel_read() does.
+    """
+    try:
+        port.cancel_read()
+    except Exception:
+        pass
+    try:
+        port.close()
+    except Exception:
+        pass
+
 def _serial_try_connect():
-    global ser, _serial_port_name
+    global ser, _serial_port_name, _serial_fail_count
     try:
-        port = _serial_port_name or detect_arduino_port()
-        if port:
-            ser = serial.Serial(port, BAUD_RATE, timeout=0.1)
+        port = _serial_port_name
+        if not ARDUINO_PORT and (not port or not os.path.exists(port)
+                                 or _serial_fail_count >= _SERIAL_RESCAN_EVERY):
+            port = detect_arduino_port() or ""
             _serial_port_name = port
+            _serial_fail_count = 0
+        if port:
+            # No read timeout: the fallback reader thread blocks in read()
+            # until bytes arrive instead of waking up 10x a second. The Tk
+            # file handler only reads once the fd is readable.
+            ser = serial.Serial(port, BAUD_RATE, timeout=None)
+            _serial_set_low_latency(ser)
+            _serial_fail_count = 0
             print(f"Connected to Arduino on {port}")
             return True
         else:
@@ -190,11 +255,9 @@ def _serial_try_connect():
             return False
     except Exception as e:
         print(f"Could not connect to Arduino: {e}")
-        try:
-            if ser:
-                ser.close()
-        except Exception:
-            pass
+        _serial_fail_count += 1
+        if ser:
+            _serial_close(ser)
         ser = None
         return False
 
@@ -203,7 +266,7 @@ class ChannelSwitcherApp:
 
     - Shows four input tiles; red = Program, green outline = Preview (CUE).
     - Keyboard: 1..4 to set CUE, Space to Cut, 0 to clear CUE.
-    - Periodically maintains ATEM and Arduino connections.
+    - ATEM reconnects are left to PyATEMMax; the Arduino is retried with backoff.
     """
     def __init__(self, root):
         self.root = root
@@ -223,35 +286,74 @@ class ChannelSwitcherApp:
         self.arduino_status_lbl = tk.Label(self.status_frame, text='Arduino: —', width=30, anchor='w')
         self.atem_status_lbl.pack(side='left')
         self.arduino_status_lbl.pack(side='left', padx=(10,0))
-
-        # Store rect IDs so we can update them
-        self.rects = []
-        self.texts = []
-
-        self.draw_rects()
+        # Last (atem_ok, arduino_ok, port_name) shown, to skip no-op relabels
+        self._last_status = (None, None, None)
+
+        # Create the tiles once; updates only reconfigure these item IDs
+        self._rect_ids = []
+        self._text_ids = []
+        self._build_rects()
+
+        # Serial input: fd registered with Tk's event loop (None if not attached)
+        self._serial_fd = None
+        self._rx_buf = bytearray()
+        # Fallback reader thread (no createfilehandler) hands lines over here
+        self._serial_q = queue.Queue()
+
+        # ATEM commands are queued as (op, *args) and sent by a worker thread
+        self.cmd_q = queue.Queue()
+        # A cut right after a preview change waits for it to settle
+        self._preview_dirty = False
+        self._last_preview_sent_ts = 0.0
+        threading.Thread(target=self._atem_worker, daemon=True).start()
+        switcher.registerEvent(switcher.atem.events.connect, lambda _: self.cmd_q.put(('init',)))
+        self.cmd_q.put(('connect',))
+
+        self._refresh_rects()
         self.update_status_labels()
 
-        # Bind keys
+        # Bind keys; on_key dispatches on event.char
+        self._key_handlers = {c: functools.partial(self._set_cue, int(c)) for c in '1234'}
+        self._key_handlers['0'] = self._clear_cue
+        self._key_handlers[' '] = self.trigger
         for key in ['1', '2', '3', '4', '0']:
             self.root.bind(key, self.on_key)
         self.root.bind('<space>', self.on_key)  # spacebar for cut
 
-        # Backoff state for reconnections
-        self.atem_backoff = 1.0
-        self.atem_backoff_max = 10.0
+        # Backoff state for serial reconnections
         self.serial_backoff = 1.0
         self.serial_backoff_max = 10.0
 
-        # Start periodic tasks
-        self.ensure_connections()
-        self.poll_serial()
+        # Periodic tasks share one timer: a heap of (deadline, seq, fn) entries
+        self._timers = []
+        self._timer_seq = itertools.count()
+        self._timer_job = None
+        self._timer_deadline = None
+        self._schedule(0, self._ensure_serial)
+        self._schedule(1.0, self._refresh_status)
 
-    def draw_rects(self):
-        """Render the 4 input tiles with current PRG/CUE state."""
-        self.canvas.delete("all")
+    def _build_rects(self):
+        """Create the 4 input tiles and their labels."""
         start_x, start_y = 20, 20
         rect_w, rect_h, gap = 120, 100, 20
 
+        for i in range(1, 5):
+            rect_id = self.canvas.create_rectangle(
+                start_x, start_y,
+                start_x + rect_w, start_y + rect_h,
+                fill='white', outline='black', width=3
+            )
+            text_id = self.canvas.create_text(
+                start_x + rect_w / 2,
+                start_y + rect_h / 2,
+                text=str(i), font=('Helvetica', 32, 'bold')
+            )
+            self._rect_ids.append(rect_id)
+            self._text_ids.append(text_id)
+            start_x += rect_w + gap
+
+    def _refresh_rects(self):
+        """Restyle the 4 input tiles with current PRG/CUE state."""
         for i in range(1, 5):
             if i == self.PRG:
                 fill = 'red'
@@ -264,147 +366,252 @@ class ChannelSwitcherApp:
                 outline_color = 'green'
                 width = 7
 
-            rect_id = self.canvas.create_rectangle(
-                start_x, start_y,
-                start_x + rect_w, start_y + rect_h,
-                fill=fill, outline=outline_color, width=width
-            )
-            text_id = self.canvas.create_text(
-                start_x + rect_w / 2,
-                start_y + rect_h / 2,
-                text=str(i), font=('Helvetica', 32, 'bold')
-            )
-            self.rects.append(rect_id)
-            self.texts.append(text_id)
-            start_x += rect_w + gap
+            self.canvas.itemconfig(self._rect_ids[i - 1], fill=fill, outline=outline_color, width=width)
 
     def trigger(self):
-        """Perform a CUT: set PRG = CUE and send ATEM commands if connected."""
+        """Perform a CUT: set PRG = CUE and send ATEM commands if connected.
+
+        The ATEM commands are staged with root.after() rather than sleeping and
+        sent by the ATEM worker thread, so the Tk mainloop never blocks on them.
+        The cut waits up to 50 ms only if a preview change was just sent.
+        """
         self.PRG = self.CUE
-        try:
-            if _atem_is_connected():
-                time.sleep(0.05)
-                switcher.execCutME(0)
-                switcher.setPreviewInputVideoSource(0, self.CUE)
-                switcher.setProgramInputVideoSource(0, self.PRG)  # not needed
-                time.sleep(0.2)
+        if _atem_connected:
+            wait = 0.0
+            if self._preview_dirty:
+                wait = max(0.0, 0.05 - (time.monotonic() - self._last_preview_sent_ts))
+                self._preview_dirty = False
+            if wait > 0:
+                self.root.after(int(wait * 1000), self._trigger_cut, self.CUE)
             else:
-                # Trigger reconnection attempts ASAP
-                self.atem_backoff = 1.0
-        except Exception as e:
-            print(f"ATEM command error: {e}")
-            self.atem_backoff = 1.0
+                self._trigger_cut(self.CUE)
         self.update_display()
 
-    def on_key(self, event):
-        """Handle keyboard events for CUE selection and CUT trigger."""
-        if event.char in ['1', '2', '3', '4']:
-            self.CUE = int(event.char)
+    def _trigger_cut(self, cue):
+        self.cmd_q.put(('cut',))
+        self.cmd_q.put(('preview', cue))
+        self.root.after(200, self.cmd_q.put, ('program', cue))
+
+    def _atem_worker(self):
+        """Run queued ATEM commands off the Tk thread so network stalls can't freeze the UI."""
+        while True:
+            op, *args = self.cmd_q.get()
             try:
-                if _atem_is_connected():
-                    switcher.setPreviewInputVideoSource(0, self.CUE)
-                else:
-                    self.atem_backoff = 1.0
+                if op == 'connect':
+                    switcher.connect(ATEM_IP)
+                    continue
+                if not _atem_connected:
+                    continue
+                if op == 'init':
+                    print("ATEM connected")
+                    # The handshake already delivered the switcher state, so
+                    # only send what actually differs (e.g. after a short drop)
+                    if abs(switcher.audioMixer.master.volume) > 0.01:
+                        switcher.setAudioMixerMasterVolume(0)
+                    # Optionally set initial inputs
+                    if switcher.programInput[0].videoSource.value != self.PRG:
+                        switcher.setProgramInputVideoSource(0, self.PRG)
+                    if switcher.previewInput[0].videoSource.value != self.CUE:
+                        switcher.setPreviewInputVideoSource(0, self.CUE)
+                elif op == 'cut':
+                    switcher.execCutME(0)
+                elif op == 'preview':
+                    switcher.setPreviewInputVideoSource(0, *args)
+                elif op == 'program':
+                    switcher.setProgramInputVideoSource(0, *args)
             except Exception as e:
-                print(f"ATEM preview set error: {e}")
-                self.atem_backoff = 1.0
-        if event.char == '0':
-            self.CUE = 0
-        elif event.keysym == 'space':
-           self.trigger()
-        
+                print(f"ATEM command error ({op}): {e}")
+                _atem_set_connected(switcher.connected)
+
+    def on_key(self, event):
+        """Handle keyboard events for CUE selection and CUT trigger."""
+        handler = self._key_handlers.get(event.char)
+        if handler is None and event.keysym == 'space':
+            handler = self.trigger
+        if handler is not None:
+            handler()
         self.update_display()
 
+    def _set_cue(self, cue):
+        self.CUE = cue
+        if _atem_connected:
+            self.cmd_q.put(('preview', cue))
+            self._preview_dirty = True
+            self._last_preview_sent_ts = time.monotonic()
+
+    def _clear_cue(self):
+        self.CUE = 0
+
     def update_display(self):
         """Refresh the canvas and status labels."""
-        self.draw_rects()
+        self._refresh_rects()
         self.update_status_labels()
 
     def update_status_labels(self):
-        atem_ok = _atem_is_connected()
+        """Refresh the status labels; labels whose state is unchanged are not touched."""
+        atem_ok = _atem_connected
         arduino_ok = bool(ser and getattr(ser, 'is_open', False))
-        # Details
-        atem_text = f"ATEM ({ATEM_IP}): {'Connected' if atem_ok else 'Disconnected'}"
         port_name = None
         try:
             port_name = ser.port if (ser and ser.is_open) else (_serial_port_name or 'auto')
         except Exception:
             port_name = _serial_port_name or 'auto'
-        arduino_text = f"Arduino ({port_name}): {'Connected' if arduino_ok else 'Disconnected'}"
+        status = (atem_ok, arduino_ok, port_name)
+        if status == self._last_status:
+            return
+        last_atem_ok, last_arduino_ok, last_port_name = self._last_status
+        self._last_status = status
+
+        # Details
+        if atem_ok != last_atem_ok:
+            atem_text = f"ATEM ({ATEM_IP}): {'Connected' if atem_ok else 'Disconnected'}"
+            self.atem_status_lbl.config(text=atem_text, fg=('green' if atem_ok else 'red'))
+        if (arduino_ok, port_name) != (last_arduino_ok, last_port_name):
+            arduino_text = f"Arduino ({port_name}): {'Connected' if arduino_ok else 'Disconnected'}"
+            if arduino_ok != last_arduino_ok:
+                self.arduino_status_lbl.config(text=arduino_text, fg=('green' if arduino_ok else 'red'))
+            else:
+                self.arduino_status_lbl.config(text=arduino_text)
 
-        self.atem_status_lbl.config(text=atem_text, fg=('green' if atem_ok else 'red'))
-        self.arduino_status_lbl.config(text=arduino_text, fg=('green' if arduino_ok else 'red'))
+    def _serial_attach(self):
+        """Watch the serial fd from Tk's event loop; fall back to a reader thread."""
+        if self._serial_fd is not None:
+            return
+        try:
+            fd = ser.fileno()
+            self.root.tk.createfilehandler(fd, tk.READABLE, self._on_serial_readable)
+            self._serial_fd = fd
+        except Exception:
+            # createfilehandler is not available on Windows
+            threading.Thread(target=self._serial_reader, args=(ser,), daemon=True).start()
 
-    def poll_serial(self):
-        """Check Arduino serial for '1' and trigger action. Reconnect on errors."""
+    def _serial_detach(self):
+        """Unregister the serial fd from Tk and close the port."""
         global ser
-        try:
-            if ser and ser.is_open and ser.in_waiting:
-                data = ser.readline().decode('utf-8', errors='ignore').strip()
-                if data == "1":
-                    time.sleep(0.2)
-                    self.trigger()
-        except Exception as e:
-            print(f"Serial read error: {e}")
+        if self._serial_fd is not None:
             try:
-                if ser:
-                    ser.close()
+                self.root.tk.deletefilehandler(self._serial_fd)
             except Exception:
                 pass
-            ser = None
-            # So that ensure_connections will try sooner
-            self.serial_backoff = 1.0
+            self._serial_fd = None
+        self._rx_buf.clear()
+        # Clear ser first so a woken reader thread exits quietly
+        port, ser = ser, None
+        if port:
+            _serial_close(port)
+        # So that _ensure_serial backs off from the minimum again
+        self.serial_backoff = 1.0
 
-        # Schedule next check in 50 ms
-        self.root.after(50, self.poll_serial)
+    def _on_serial_readable(self, fd, mask):
+        """Tk file handler: drain what arrived and act on complete lines."""
+        try:
+            self._drain_serial()
+        except Exception as e:
+            print(f"Serial read error: {e}")
+            self._serial_detach()
 
-    def ensure_connections(self):
-        """Maintain stable connections to ATEM and Arduino with backoff retries."""
-        # ATEM reconnect
-        if not _atem_is_connected():
-            def _connect_atem_async():
-                ok = _atem_connect_blocking()
-                if ok:
-                    print("ATEM connected")
-                    try:
-                        switcher.setAudioMixerMasterVolume(0)
-                        # Optionally set initial inputs
-                        switcher.setProgramInputVideoSource(0, self.PRG)
-                        switcher.setPreviewInputVideoSource(0, self.CUE)
-                    except Exception as e:
-                        print(f"ATEM post-connect init error: {e}")
-                    self.atem_backoff = 1.0
-                else:
-                    self.atem_backoff = min(self.atem_backoff * 2.0, self.atem_backoff_max)
+    def _drain_serial(self):
+        """Read everything buffered in one call and dispatch each full line."""
+        self._rx_buf += ser.read(ser.in_waiting or 1)
+        while b"\n" in self._rx_buf:
+            line, _, self._rx_buf = self._rx_buf.partition(b"\n")
+            self._on_serial_line(line)
 
-            threading.Thread(target=_connect_atem_async, daemon=True).start()
-        else:
-            self.atem_backoff = 1.0
+    def _on_serial_line(self, line):
+        if line.strip() == b"1":
+            self.root.after(200, self.trigger)
 
-        # Serial reconnect
-        global ser
+    def _serial_reader(self, port):
+        """Fallback reader thread: block in read() and pass complete lines to Tk.
+
+        Exits once the port is detached (the global ser no longer refers to it).
+        """
+        buf = bytearray()
+        try:
+            while port is ser:
+                data = port.read(port.in_waiting or 1)
+                if not data:
+                    continue
+                buf += data
+                if b"\n" not in buf:
+                    continue
+                while b"\n" in buf:
+                    line, _, buf = buf.partition(b"\n")
+                    self._serial_q.put(line)
+                self.root.after(0, self._on_serial_data)
+        except Exception as e:
+            if port is ser:
+                self._serial_q.put(e)
+                self.root.after(0, self._on_serial_data)
+
+    def _on_serial_data(self):
+        """Drain lines queued by _serial_reader (runs on the Tk thread)."""
+        while True:
+            try:
+                item = self._serial_q.get_nowait()
+            except queue.Empty:
+                return
+            if isinstance(item, Exception):
+                print(f"Serial read error: {item}")
+                self._serial_detach()
+            else:
+                self._on_serial_line(item)
+
+    def _schedule(self, delay_s, fn):
+        """Run fn after delay_s seconds; if fn returns a number, it is rescheduled with that delay."""
+        deadline = time.monotonic() + delay_s
+        heapq.heappush(self._timers, (deadline, next(self._timer_seq), fn))
+        self._arm_timer()
+
+    def _arm_timer(self):
+        """Keep a single root.after pending for the earliest deadline."""
+        if not self._timers:
+            return
+        deadline = self._timers[0][0]
+        if self._timer_job is not None:
+            if self._timer_deadline <= deadline:
+                return
+            self.root.after_cancel(self._timer_job)
+        delay_ms = max(0, int((deadline - time.monotonic()) * 1000))
+        self._timer_deadline = deadline
+        self._timer_job = self.root.after(delay_ms, self._tick)
+
+    def _tick(self):
+        self._timer_job = None
+        now = time.monotonic()
+        while self._timers and self._timers[0][0] <= now:
+            _, _, fn = heapq.heappop(self._timers)
+            try:
+                delay_s = fn()
+            except Exception as e:
+                print(f"Scheduled task error: {e}")
+                delay_s = 1.0
+            if delay_s is not None:
+                heapq.heappush(self._timers, (now + delay_s, next(self._timer_seq), fn))
+        self._arm_timer()
+
+    def _ensure_serial(self):
+        """Reconnect to the Arduino with backoff; returns seconds until next check."""
         if not (ser and getattr(ser, 'is_open', False)):
             ok = _serial_try_connect()
             if ok:
                 self.serial_backoff = 1.0
+                self._serial_attach()
             else:
                 self.serial_backoff = min(self.serial_backoff * 2.0, self.serial_backoff_max)
+            self.update_status_labels()
         else:
             self.serial_backoff = 1.0
+        return max(0.2, self.serial_backoff)
 
-        # Re-run after the smaller backoff among the two (converted to ms)
-        delay_s = min(self.atem_backoff, self.serial_backoff)
-        delay_ms = int(max(200, delay_s * 1000))
-        # Update UI status as well
+    def _refresh_status(self):
+        """Slow status refresh; picks up connection changes made off the Tk thread."""
         self.update_status_labels()
-        self.root.after(delay_ms, self.ensure_connections)
+        return 1.0
 
 def main():
-    if _atem_is_connected():
-        try:
-            switcher.setProgramInputVideoSource(0, 1)
-        except Exception as e:
-            print(f"ATEM initial program set error: {e}")
+    _load_runtime_modules()
+    _atem_create()
     root = tk.Tk()
     app = ChannelSwitcherApp(root)
     root.mainloop()
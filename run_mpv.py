@@ -27,50 +27,62 @@ import sys
 import json
 import platform
 import socket
+import select
 import subprocess
 import shutil
 import shlex
-import serial
-from serial.tools import list_ports
+import re
+import glob
+import functools
+import itertools
+import random
+import concurrent.futures
 import threading
 
+from envfile import parse_env_text
+
+# mpv IPC encoding: use orjson (bytes in/out, C-accelerated) when installed
+try:
+    import orjson
+
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj):
+        return json.dumps(obj).encode("utf-8")
+
+    def _json_loads(data):
+        # json.loads takes bytes but not memoryview slices
+        return json.loads(bytes(data))
+
+
+def _parse_env_file(path):
+    """Parse simple KEY=VALUE pairs from a .env file into a dict."""
+    with open(path, 'r', encoding='utf-8') as f:
+        return parse_env_text(f.read())
+
+
+def _apply_env(values):
+    """Set .env values that are not already present in os.environ."""
+    for key, val in values.items():
+        if key not in os.environ:
+            os.environ[key] = val
+
 
 def _load_env_file():
     """Load simple KEY=VALUE pairs from a .env file, if present."""
-    candidates = [os.path.join(os.getcwd(), ".env")]
-    try:
-        if getattr(sys, 'frozen', False):
-            exec_dir = os.path.dirname(sys.executable)
-        else:
-            exec_dir = os.path.dirname(os.path.abspath(__file__))
-        candidates.append(os.path.join(exec_dir, ".env"))
-    except Exception:
-        pass
-    env_path = next((p for p in candidates if os.path.isfile(p)), None)
+    env_path = next((p for p in _env_candidate_paths() if os.path.isfile(p)), None)
     if not env_path:
         return
     try:
-        with open(env_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                line = line.strip()
-                if not line or line.startswith('#'):
-                    continue
-                if '#' in line and not (line.startswith('"') or line.startswith("'")):
-                    line = line.split('#', 1)[0].strip()
-                if '=' not in line:
-                    continue
-                key, val = line.split('=', 1)
-                key = key.strip()
-                val = val.strip().strip('"').strip("'")
-                if key and key not in os.environ:
-                    os.environ[key] = val
+        _apply_env(_parse_env_file(env_path))
     except Exception as e:
         print(f"Warning: could not read .env file: {e}")
 
 
-_load_env_file()
-
+@functools.lru_cache(maxsize=1)
 def _config_paths():
+    """Candidate config.json paths in lookup order (fixed for the process)."""
     paths = []
     env_path = os.getenv("KAREL_CONFIG")
     if env_path:
@@ -84,15 +96,21 @@ def _config_paths():
     base_dir = os.path.abspath(os.path.dirname(__file__))
     paths.append(os.path.join(base_dir, "config.json"))
     paths.append(os.path.join(os.getcwd(), "config.json"))
-    return paths
+    return tuple(paths)
+
+
+def _read_json(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
 
 
+@functools.lru_cache(maxsize=1)
 def load_config():
+    """Return the first readable config.json as a dict (cached until save_config_value)."""
     for p in _config_paths():
         try:
             if os.path.isfile(p):
-                with open(p, "r", encoding="utf-8") as f:
-                    return json.load(f)
+                return _read_json(p)
         except Exception as e:
             print(f"Config read error at {p}: {e}")
     return {}
@@ -135,6 +153,7 @@ def save_config_value(key: str, value):
             json.dump(data, f, indent=2, sort_keys=True)
     except Exception as e:
         print(f"Failed to write {path}: {e}")
+    load_config.cache_clear()
 
 
 def _env_candidate_paths():
@@ -151,11 +170,54 @@ def _env_candidate_paths():
     return paths
 
 
+# .env path -> [(mtime_ns, size), {key: (start, end) byte span of its line, or None if repeated}]
+_env_layout = {}
+
+
+def _env_patch_in_place(target, key, line):
+    """Overwrite KEY's line in target in place if `line` fits; True on success.
+
+    The new text is space-padded to the old line's length, so nothing
+    else in the file moves. Line spans are cached against the file's stat
+    stamp, so repeated saves (e.g. adjusting the play delay) don't reparse.
+    """
+    try:
+        st = os.stat(target)
+    except OSError:
+        return False
+    cached = _env_layout.get(target)
+    if cached is None or cached[0] != (st.st_mtime_ns, st.st_size):
+        with open(target, "rb") as f:
+            data = f.read()
+        spans = {}
+        pos = 0
+        for raw in data.splitlines(keepends=True):
+            body = raw.rstrip(b"\r\n")
+            k, sep, _ = body.strip().partition(b"=")
+            if sep:
+                k = k.decode("utf-8", "replace")
+                spans[k] = None if k in spans else (pos, pos + len(body))
+            pos += len(raw)
+        cached = _env_layout[target] = [(st.st_mtime_ns, st.st_size), spans]
+    span = cached[1].get(key)
+    if span is None or len(line) > span[1] - span[0]:
+        return False
+    with open(target, "r+b") as f:
+        f.seek(span[0])
+        f.write(line.ljust(span[1] - span[0]))
+    st = os.stat(target)
+    cached[0] = (st.st_mtime_ns, st.st_size)
+    return True
+
+
 def save_env_value(key: str, value: str) -> bool:
     """Best-effort update or append KEY=VALUE to a .env file. Returns True if written."""
     targets = [p for p in _env_candidate_paths() if os.path.isfile(p)]
     target = targets[0] if targets else os.path.join(os.getcwd(), ".env")
     try:
+        if _env_patch_in_place(target, key, f"{key}={value}".encode("utf-8")):
+            return True
+        _env_layout.pop(target, None)
         lines = []
         if os.path.isfile(target):
             with open(target, "r", encoding="utf-8") as f:
@@ -179,7 +241,45 @@ def save_env_value(key: str, value: str) -> bool:
     return False
 
 
-_CONF = load_config()
+def _source_stamps(paths):
+    """Map each path to its mtime (ns), or None if it doesn't exist."""
+    stamps = {}
+    for p in paths:
+        try:
+            stamps[p] = os.stat(p).st_mtime_ns
+        except OSError:
+            stamps[p] = None
+    return stamps
+
+
+def _load_frozen_config():
+    """Use _config_generated.py (see tools/freeze_config.py) if it is current.
+
+    The generated module records the mtime of every .env/config.json
+    candidate it was built from; if any differ (or the candidate list
+    differs, e.g. another CWD or KAREL_CONFIG) it is ignored and None is
+    returned so the caller parses the files. Applies the frozen .env values.
+    """
+    try:
+        import _config_generated as gen
+    except ImportError:
+        return None
+    try:
+        if gen.ENV_SOURCES != _source_stamps(_env_candidate_paths()):
+            return None
+        _apply_env(gen.ENV)
+        if gen.CONFIG_SOURCES != _source_stamps(_config_paths()):
+            return None
+        return dict(gen.CONFIG)
+    except Exception:
+        return None
+
+
+# Load .env before reading any env-based configuration
+_CONF = _load_frozen_config()
+if _CONF is None:
+    _load_env_file()
+    _CONF = load_config()
 
 ATEM_IP = os.getenv("ATEM_IP", _CONF.get("ATEM_IP", "192.168.10.240"))
 ARDUINO_PORT = os.getenv("ARDUINO_PORT", _CONF.get("ARDUINO_PORT", ""))
@@ -243,31 +343,305 @@ def _as_bool(x: str) -> bool:
 MPV_SYNC_ENABLE = _as_bool(os.getenv("MPV_SYNC_ENABLE", str(_CONF.get("MPV_SYNC_ENABLE", "1"))))
 MPV_SYNC_INTERVAL_MS = int(os.getenv("MPV_SYNC_INTERVAL_MS", str(_CONF.get("MPV_SYNC_INTERVAL_MS", "150"))))  # ~6Hz
 MPV_SYNC_DRIFT_SEC = float(os.getenv("MPV_SYNC_DRIFT_SEC", str(_CONF.get("MPV_SYNC_DRIFT_SEC", "0.08"))))
+# Drift beyond this is fixed with a seek; smaller drift while playing is
+# absorbed by running the preview up to MPV_SYNC_MAX_NUDGE faster/slower.
+MPV_SYNC_SEEK_SEC = float(os.getenv("MPV_SYNC_SEEK_SEC", str(_CONF.get("MPV_SYNC_SEEK_SEC", "0.5"))))
+MPV_SYNC_MAX_NUDGE = 0.10
+MPV_SYNC_NUDGE_GAIN = 0.5  # speed change per second of drift
+# Properties the sync tick mirrors; observed on both players
+_MPV_SYNC_PROPS = ("pause", "path", "speed", "time-pos")
+
+# (monotonic timestamp, ok) of the last status probe; see mpv_status_ok()
+_mpv_status = (0.0, False)
+MPV_STATUS_TTL = 0.5
+# How often MpvClient.observe() retries connecting while mpv is down
+MPV_OBSERVE_RETRY_SEC = 0.5
+MPV_IPC_BUFSIZE = 65536
+
+
+@functools.lru_cache(maxsize=64)
+def _mpv_cmd_prefix(command):
+    """Encoded '{"command":[...],"request_id":' for a constant command tuple."""
+    return _json_dumps({"command": list(command)})[:-1] + b',"request_id":'
+
+
+@functools.lru_cache(maxsize=64)
+def _mpv_args_prefix(head):
+    """Encoded '{"command":[...,' for the constant leading strings of a command."""
+    return _json_dumps({"command": list(head)})[:-2] + b","
+
+
+def _mpv_encode(payload, rid):
+    """Encode an IPC payload tagged with request_id rid, newline-terminated.
+
+    Plain commands made only of strings and booleans (get_property pause,
+    set_property pause True, loadfile ...) are encoded once and reused.
+    Strings followed by one number (set_property speed 1.05, time-pos)
+    reuse the encoded strings and only encode the number; anything else
+    goes through the JSON encoder.
+    """
+    command = payload.get("command")
+    if len(payload) == 1 and command:
+        if all(isinstance(a, (str, bool)) for a in command):
+            return _mpv_cmd_prefix(tuple(command)) + b"%d}\n" % rid
+        last = command[-1]
+        if isinstance(last, (int, float)) and all(isinstance(a, str) for a in command[:-1]):
+            return (_mpv_args_prefix(tuple(command[:-1])) + _json_dumps(last)
+                    + b'],"request_id":%d}\n' % rid)
+    return _json_dumps(dict(payload, request_id=rid)) + b"\n"
+
+
+def _mpv_size_buffers(sock):
+    """Make sure an IPC socket can hold a pipelined batch and its replies.
+
+    mpv only listens with SOCK_STREAM, so SOCK_SEQPACKET framing isn't an
+    option. Linux already defaults AF_UNIX buffers to ~200 KiB, but macOS
+    uses 8 KiB; only ever grow them.
+    """
+    for opt in (socket.SO_SNDBUF, socket.SO_RCVBUF):
+        try:
+            if sock.getsockopt(socket.SOL_SOCKET, opt) < MPV_IPC_BUFSIZE:
+                sock.setsockopt(socket.SOL_SOCKET, opt, MPV_IPC_BUFSIZE)
+        except OSError:
+            pass
 
-def mpv_send_to(sock_path, payload):
-    """Send JSON IPC payload to a specific mpv UNIX socket."""
-    if not sock_path:
-        return None
-    try:
+
+class MpvClient:
+    """Persistent JSON IPC connection to one mpv instance.
+
+    Requests are tagged with a request_id and written under a lock; a
+    reader thread owns the receive side and completes the Future waiting
+    on each reply. mpv pushes {"event": ...} lines on every connection;
+    those are dropped, except property-change events for properties
+    registered with observe(), which keep `props` current. A reply that
+    arrives after its caller gave up is simply discarded, so a timeout
+    doesn't poison the connection.
+    """
+
+    def __init__(self, sock_path):
+        self.sock_path = sock_path
+        self._lock = threading.Lock()  # guards _sock and _pending
+        self._sock = None
+        self._pending = {}  # request_id -> Future
+        self._ids = itertools.count(1)
+        self._observed = ()  # property names, re-observed on every connect
+        self.props = {}  # name -> last value mpv reported
+        self.on_change = None  # called with the name after a props update (reader thread)
+        self._observe_retry_at = 0.0  # monotonic; observe() won't reconnect before
+
+    def _connect(self):
         client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        _mpv_size_buffers(client)
         client.settimeout(0.2)
-        client.connect(sock_path)
-        client.sendall((json.dumps(payload) + "\n").encode("utf-8"))
         try:
-            data = client.recv(4096)
-            if data:
-                return json.loads(data.decode("utf-8"))
+            client.connect(self.sock_path)
         except Exception:
+            client.close()
+            raise
+        # The reader thread blocks in recv(); _drop() wakes it via shutdown()
+        client.settimeout(None)
+        self._sock = client
+        threading.Thread(target=self._reader, args=(client,), daemon=True).start()
+        if self._observed:
+            try:
+                client.sendall(self._observe_msg(self._observed))
+            except Exception:
+                self._drop()
+                raise
+        return client
+
+    def _observe_msg(self, props):
+        # observe_property ids only need to be unique per connection
+        return b"".join(
+            _mpv_encode({"command": ["observe_property", self._observed.index(p) + 1, p]},
+                        next(self._ids))
+            for p in props)
+
+    def observe(self, props):
+        """Have mpv push changes of props into self.props.
+
+        Connects if needed; raises on connection errors. Cheap to call
+        repeatedly with the same names: while connected it does no I/O, and
+        while mpv is down it retries the connect at most every
+        MPV_OBSERVE_RETRY_SEC. A closed connection is noticed by the reader
+        thread (recv() returns b""), which clears props.
+        """
+        with self._lock:
+            if self._sock is not None and all(p in self._observed for p in props):
+                return
+            new = tuple(p for p in props if p not in self._observed)
+            self._observed += new
+            if self._sock is None:
+                now = time.monotonic()
+                if now < self._observe_retry_at:
+                    raise ConnectionRefusedError("mpv IPC down; retrying later")
+                try:
+                    self._connect()
+                except Exception:
+                    self._observe_retry_at = now + MPV_OBSERVE_RETRY_SEC
+                    raise
+                return
+            try:
+                self._sock.sendall(self._observe_msg(new))
+            except Exception:
+                self._drop()
+                raise
+
+    def _drop(self):
+        """Close the connection and fail outstanding requests. Caller holds _lock."""
+        sock, self._sock = self._sock, None
+        if sock is not None:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            sock.close()
+        # Values from the old connection may be stale by the next one
+        self.props = {}
+        pending, self._pending = self._pending, {}
+        for fut in pending.values():
+            fut.set_exception(ConnectionResetError("mpv IPC connection closed"))
+        if self.sock_path == MPV_SOCKET:
+            # Connection trouble: make the next status check probe again
+            _mpv_status_invalidate()
+
+    def _reader(self, sock):
+        # One preallocated receive buffer; unread bytes are buf[start:end].
+        # Lines are parsed straight from memoryview slices, without copies.
+        buf = bytearray(65536)
+        view = memoryview(buf)
+        start = end = 0
+        try:
+            while True:
+                if end == len(buf):
+                    if start:
+                        # Move the partial line to the front
+                        buf[:end - start] = bytes(view[start:end])
+                        end -= start
+                        start = 0
+                    else:
+                        # A single line larger than the buffer
+                        grown = bytearray(2 * len(buf))
+                        grown[:end] = view[:end]
+                        buf, view = grown, memoryview(grown)
+                n = sock.recv_into(view[end:])
+                if not n:
+                    break
+                end += n
+                while True:
+                    nl = buf.find(b"\n", start, end)
+                    if nl < 0:
+                        break
+                    line = view[start:nl]
+                    start = nl + 1
+                    # Event lines are the bulk of the traffic; skip them unparsed
+                    if not line:
+                        continue
+                    if buf.startswith(b'{"event"', nl - len(line)):
+                        if self._observed and buf.startswith(b'{"event":"property-change"', nl - len(line)):
+                            try:
+                                ev = _json_loads(line)
+                                name = ev["name"]
+                            except (ValueError, KeyError, TypeError):
+                                continue
+                            with self._lock:
+                                # A reader outliving its socket must not write
+                                # into the next connection's props
+                                if self._sock is not sock:
+                                    return
+                                # "data" is absent while the property is unavailable
+                                self.props[name] = ev.get("data")
+                            if self.on_change is not None:
+                                self.on_change(name)
+                        continue
+                    try:
+                        resp = _json_loads(line)
+                    except ValueError:
+                        continue
+                    if not isinstance(resp, dict) or "event" in resp:
+                        continue
+                    with self._lock:
+                        fut = self._pending.pop(resp.get("request_id"), None)
+                    if fut is not None:
+                        fut.set_result(resp)
+                if start == end:
+                    start = end = 0
+        except OSError:
             pass
+        finally:
+            with self._lock:
+                if self._sock is sock:
+                    self._drop()
+
+    def request(self, payloads, wait=True, timeout=0.2):
+        """Write payloads in one go; return their replies in order.
+
+        With wait=False the replies are not awaited and True is returned
+        once the write went out.
+        Raises on connection errors or if the replies take longer than
+        `timeout` in total.
+        """
+        futures = []
+        lines = []
+        for payload in payloads:
+            rid = next(self._ids)
+            lines.append(_mpv_encode(payload, rid))
+            if wait:
+                futures.append((rid, concurrent.futures.Future()))
+        msg = b"".join(lines)
+        with self._lock:
+            for attempt in (1, 2):
+                try:
+                    (self._sock or self._connect()).sendall(msg)
+                    # Safe to register after sending: the reader needs
+                    # _lock to hand out replies
+                    self._pending.update(futures)
+                    break
+                except (BrokenPipeError, ConnectionResetError):
+                    # mpv went away since the last call; reconnect once
+                    self._drop()
+                    if attempt == 2:
+                        raise
+                except Exception:
+                    self._drop()
+                    raise
+        if not wait:
+            return True
+        deadline = time.monotonic() + timeout
+        try:
+            return [fut.result(max(0.0, deadline - time.monotonic())) for _, fut in futures]
+        except concurrent.futures.TimeoutError:
+            with self._lock:
+                for rid, _ in futures:
+                    self._pending.pop(rid, None)
+            raise socket.timeout("no reply from mpv")
+
+    def send(self, payload, wait=True):
+        replies = self.request((payload,), wait=wait)
+        # Without wait, request() returns True once the write went out
+        return replies[0] if wait else replies
+
+
+_mpv_clients = {}  # sock_path -> MpvClient
+
+
+def _mpv_client(sock_path):
+    client = _mpv_clients.get(sock_path)
+    if client is None:
+        client = _mpv_clients.setdefault(sock_path, MpvClient(sock_path))
+    return client
+
+
+def mpv_send_to(sock_path, payload, wait=True):
+    """Send JSON IPC payload to a specific mpv UNIX socket."""
+    if not sock_path:
+        return None
+    try:
+        return _mpv_client(sock_path).send(payload, wait=wait)
     except Exception as e:
         # keep quiet-ish; caller decides what to log
         # print(f"mpv IPC({sock_path}) error: {e}")
         pass
-    finally:
-        try:
-            client.close()
-        except Exception:
-            pass
     return None
 
 def mpv_get(sock_path, prop, default=None):
@@ -280,7 +654,38 @@ def mpv_get(sock_path, prop, default=None):
     return default
 
 def mpv_set(sock_path, prop, value):
-    mpv_send_to(sock_path, {"command": ["set_property", prop, value]})
+    # Fire-and-forget: later requests on the same connection run after it
+    mpv_send_to(sock_path, {"command": ["set_property", prop, value]}, wait=False)
+
+def mpv_observed(sock_path, props):
+    """Shadow dict of props, kept current by mpv property-change events.
+
+    Returns None if mpv can't be reached. Properties mpv hasn't reported
+    yet (or can't provide) are missing or None.
+    """
+    if not sock_path:
+        return None
+    client = _mpv_client(sock_path)
+    try:
+        client.observe(props)
+    except Exception:
+        return None
+    return client.props
+
+def mpv_get_many(sock_path, props, default=None):
+    """Read several properties in one pipelined round trip.
+
+    Returns a list of values (default for any mpv couldn't provide), or
+    None if mpv didn't answer at all.
+    """
+    if not sock_path:
+        return None
+    try:
+        replies = _mpv_client(sock_path).request([{"command": ["get_property", p]} for p in props])
+    except Exception:
+        return None
+    return [r.get("data") if isinstance(r, dict) and r.get("error") == "success" else default
+            for r in replies]
 
 def _mpv_ipc_ready_socket(sock_path):
     try:
@@ -295,48 +700,91 @@ def mpv_send(payload):
     if not MPV_SOCKET:
         return None
     try:
-        client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-        client.settimeout(0.2)
-        client.connect(MPV_SOCKET)
-        msg = (json.dumps(payload) + "\n").encode("utf-8")
-        client.sendall(msg)
-        try:
-            data = client.recv(4096)
-            if data:
-                return json.loads(data.decode("utf-8"))
-        except Exception:
-            pass
+        return _mpv_client(MPV_SOCKET).send(payload)
     except Exception as e:
         # Keep quiet to not spam; the status line will show mpv state
         print(f"mpv IPC error: {e}")
-    finally:
-        try:
-            client.close()
-        except Exception:
-            pass
     return None
 
 
+def _mpv_status_invalidate():
+    global _mpv_status
+    _mpv_status = (0.0, False)
+
+
+def mpv_status_ok():
+    """True if the program mpv answers IPC; probed at most every MPV_STATUS_TTL s."""
+    global _mpv_status
+    now = time.monotonic()
+    ts, ok = _mpv_status
+    if now - ts < MPV_STATUS_TTL:
+        return ok
+    # simple check by trying to get 'pause' property
+    try:
+        resp = mpv_send({"command": ["get_property", "pause"]})
+        ok = isinstance(resp, dict) and resp.get('error') == 'success'
+    except Exception:
+        ok = False
+    _mpv_status = (now, ok)
+    return ok
+
+
+def mpv_send_many(commands, sock_path=None, wait=True):
+    """Pipeline several IPC commands in one write; returns their replies.
+
+    mpv runs commands in arrival order. Defaults to the program socket.
+    Returns None on error. When wait is False it returns right away: True
+    once the commands were written.
+    """
+    sock_path = sock_path or MPV_SOCKET
+    if not sock_path or not commands:
+        return None
+    try:
+        return _mpv_client(sock_path).request([{"command": c} for c in commands], wait=wait)
+    except Exception as e:
+        if sock_path == MPV_SOCKET:
+            print(f"mpv IPC error: {e}")
+    return None
+
+
+# (path, monotonic deadline) of the last loadfile sent to the preview. Its
+# path property only catches up once the file has opened; until then the
+# sync tick must not send the same loadfile again.
+_preview_load_pending = ("", 0.0)
+PREVIEW_LOAD_HOLD_SEC = 2.0
+
+
+def _preview_load_sent(path):
+    global _preview_load_pending
+    _preview_load_pending = (path, time.monotonic() + PREVIEW_LOAD_HOLD_SEC)
+
+
+def _preview_load_in_flight(path):
+    pending_path, until = _preview_load_pending
+    return path == pending_path and time.monotonic() < until
+
+
+def _load_and_pause_cmds(path):
+    # Pause first so the new file never starts rolling; a freshly loaded
+    # file starts at 0 (a time-pos seek sent before loading finishes fails).
+    return [["set_property", "pause", True], ["loadfile", path, "replace"]]
+
+
 def mpv_load_and_pause(path):
     if not path:
         return False
     # Load on program
-    mpv_send({"command": ["loadfile", path, "replace"]})
-    time.sleep(0.05)
-    mpv_send({"command": ["set_property", "pause", True]})
-    mpv_send({"command": ["set_property", "time-pos", 0]})
+    mpv_send_many(_load_and_pause_cmds(path), wait=False)
     # Load on preview too (best-effort)
     if MPV_PREVIEW_ENABLE and MPV_PREVIEW_SOCKET:
-        mpv_send_to(MPV_PREVIEW_SOCKET, {"command": ["loadfile", path, "replace"]})
-        time.sleep(0.02)
-        mpv_send_to(MPV_PREVIEW_SOCKET, {"command": ["set_property", "pause", True]})
-        mpv_send_to(MPV_PREVIEW_SOCKET, {"command": ["set_property", "time-pos", 0]})
+        if mpv_send_many(_load_and_pause_cmds(path), MPV_PREVIEW_SOCKET, wait=False):
+            _preview_load_sent(path)
     return True
 
 def mpv_play():
-    mpv_send({"command": ["set_property", "pause", False]})
+    mpv_set(MPV_SOCKET, "pause", False)
     if MPV_PREVIEW_ENABLE and MPV_PREVIEW_SOCKET:
-        mpv_send_to(MPV_PREVIEW_SOCKET, {"command": ["set_property", "pause", False]})
+        mpv_set(MPV_PREVIEW_SOCKET, "pause", False)
 
 
 def _mpv_ipc_ready():
@@ -347,6 +795,87 @@ def _mpv_ipc_ready():
         return False
 
 
+def _drm_connected_count():
+    """Number of connected display connectors per /sys/class/drm, or None if unavailable."""
+    try:
+        statuses = glob.glob("/sys/class/drm/card*-*/status")
+        if not statuses:
+            return None
+        count = 0
+        for path in statuses:
+            with open(path, "r") as f:
+                if f.read().strip() == "connected":
+                    count += 1
+        return count
+    except Exception:
+        return None
+
+
+@functools.lru_cache(maxsize=1)
+def _detect_secondary_monitor_name():
+    """Name of a non-primary monitor from `xrandr --listmonitors`, or None.
+
+    Cached for the process lifetime; xrandr isn't run at all when the kernel
+    reports fewer than two connected displays.
+    """
+    try:
+        if platform.system() != "Linux" or not _resolve_bin("xrandr"):
+            return None
+        connected = _drm_connected_count()
+        if connected is not None and connected < 2:
+            return None
+        out = subprocess.check_output(["xrandr", "--listmonitors"], text=True, stderr=subprocess.DEVNULL)
+        primary = None
+        names = []
+        for line in out.splitlines():
+            parts = line.split()
+            if len(parts) < 2 or parts[0] == "Monitors:":
+                continue
+            tok = parts[1]
+            name = tok.lstrip("+*")
+            if "*" in tok:
+                primary = name
+            names.append(name)
+        if len(names) >= 2:
+            for n in names:
+                if n != primary:
+                    return n
+    except Exception:
+        return None
+    return None
+
+
+@functools.lru_cache(maxsize=4)
+def _resolve_bin(name):
+    """Resolve an executable name or path like the shell would; None if not found.
+
+    Cached, as $PATH doesn't change while we run.
+    """
+    if os.path.isabs(name):
+        return name
+    if os.path.sep in name:
+        return name if shutil.which(name) else None
+    return shutil.which(name)
+
+
+def _wait_socket(sock_path, timeout, proc=None):
+    """Wait up to `timeout` s for a freshly started mpv to answer on sock_path.
+
+    Checks for the socket file every 25 ms and only sends the IPC probe once
+    it exists. Gives up early if `proc` (the mpv process) has exited, e.g.
+    because an --fs-screen attempt was rejected.
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        if os.path.exists(sock_path) and _mpv_ipc_ready_socket(sock_path):
+            return True
+        if proc is not None and proc.poll() is not None:
+            return False
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(0.025)
+
+
 _mpv_proc = None
 
 def launch_mpv_if_needed():
@@ -366,33 +895,9 @@ def launch_mpv_if_needed():
         except Exception as e:
             print(f"Cannot ensure socket dir for {sock_path}: {e}")
 
-    def _detect_secondary_monitor_name():
-        try:
-            if platform.system() != "Linux" or not shutil.which("xrandr"):
-                return None
-            out = subprocess.check_output(["xrandr", "--listmonitors"], text=True, stderr=subprocess.DEVNULL)
-            primary = None
-            names = []
-            for line in out.splitlines():
-                line = line.strip()
-                if not line or line.startswith("Monitors:"):
-                    continue
-                tok = (line.split()[1] if len(line.split()) > 1 else "")
-                name = tok.lstrip("+*")
-                if "*" in tok:
-                    primary = name
-                names.append(name)
-            if len(names) >= 2:
-                for n in names:
-                    if n != primary:
-                        return n
-        except Exception:
-            return None
-        return None
-
     # Resolve mpv binary
-    mpv_bin = MPV_PATH if (os.path.isabs(MPV_PATH) or os.path.sep in MPV_PATH) else (shutil.which(MPV_PATH) or MPV_PATH)
-    if not (os.path.isabs(mpv_bin) or shutil.which(mpv_bin)):
+    mpv_bin = _resolve_bin(MPV_PATH)
+    if not mpv_bin:
         print(f"mpv not found on PATH (MPV_PATH={MPV_PATH}).")
         return False
 
@@ -427,12 +932,7 @@ def launch_mpv_if_needed():
                 _mpv_proc = None
                 continue
 
-            for _ in range(50):  # up to ~5s
-                if _mpv_ipc_ready_socket(MPV_SOCKET):
-                    prog_ready = True
-                    break
-                time.sleep(0.1)
-
+            prog_ready = _wait_socket(MPV_SOCKET, 5.0, _mpv_proc)
             if prog_ready:
                 break
 
@@ -461,33 +961,31 @@ def launch_mpv_if_needed():
             ] + (shlex.split(MPV_PREVIEW_ARGS) if MPV_PREVIEW_ARGS else [])
 
             try:
-                subprocess.Popen(prev_cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+                prev_proc = subprocess.Popen(prev_cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
             except Exception as e:
                 print(f"Failed to start mpv (preview): {e}")
             else:
                 # Give it a moment to come up (don’t block too long)
-                for _ in range(30):  # up to ~3s
-                    if _mpv_ipc_ready_socket(MPV_PREVIEW_SOCKET):
-                        break
-                    time.sleep(0.1)
-
-        # Optionally preload the same video in preview (only if main was preloaded elsewhere)
-        if VIDEO_FILE and os.path.isfile(VIDEO_FILE):
-            # Only load if preview isn’t already on that file (best-effort)
-            mpv_send_to(MPV_PREVIEW_SOCKET, {"command": ["loadfile", VIDEO_FILE, "replace"]})
-            time.sleep(0.05)
-            mpv_send_to(MPV_PREVIEW_SOCKET, {"command": ["set_property", "pause", True]})
-            mpv_send_to(MPV_PREVIEW_SOCKET, {"command": ["set_property", "time-pos", 0]})
+                _wait_socket(MPV_PREVIEW_SOCKET, 3.0, prev_proc)
 
     return bool(prog_ready)
 
-# PyATEMMax connection
-import PyATEMMax
-
-switcher = PyATEMMax.ATEMMax()
+# PyATEMMax connection (imported on first use so the window comes up first)
+switcher = None
 _atem_lock = threading.Lock()
 
 
+def _get_switcher():
+    """Return the shared ATEMMax instance, importing PyATEMMax on first call."""
+    global switcher
+    if switcher is None:
+        with _atem_lock:
+            if switcher is None:
+                import PyATEMMax
+                switcher = PyATEMMax.ATEMMax()
+    return switcher
+
+
 def _atem_is_connected():
     try:
         return bool(getattr(switcher, "connected", False))
@@ -497,11 +995,12 @@ def _atem_is_connected():
 
 def _atem_connect_blocking():
     try:
+        sw = _get_switcher()
         with _atem_lock:
             if _atem_is_connected():
                 return True
-            switcher.connect(ATEM_IP)
-            switcher.waitForConnection()
+            sw.connect(ATEM_IP)
+            sw.waitForConnection()
             return _atem_is_connected()
     except Exception as e:
         print(f"ATEM connect error: {e}")
@@ -513,17 +1012,95 @@ ser = None
 _serial_port_name = ARDUINO_PORT
 
 
+# pyserial is imported by _load_serial_modules(), started on a background
+# thread from ChannelSwitcherApp, so it doesn't delay the first window paint.
+serial = None
+list_ports = None
+_serial_import_lock = threading.Lock()
+
+
+def _load_serial_modules():
+    global serial, list_ports
+    with _serial_import_lock:
+        if list_ports is None:
+            import serial as _serial
+            from serial.tools import list_ports as _list_ports
+            serial = _serial
+            list_ports = _list_ports
+
+
+# Port description / device path patterns that look like an Arduino. The
+# device pattern covers ttyUSB/ttyACM/tty.usb*/tty.SLAB_USB*/tty.wchusbserial*
+# as well as any other /dev/tty* name mentioning usb, ACM or SLAB.
+_ARDUINO_DESC_RE = re.compile(r"arduino|ch340|wchusbserial|usb[- ]serial|cp210|ftdi", re.I)
+_ARDUINO_DEV_RE = re.compile(r"^/dev/tty.*(?:(?i:usb)|ACM|SLAB)")
+
+# list_ports.comports() rescans sysfs//dev; reuse a scan for a short while
+_COMPORTS_TTL = 2.0
+_comports_cache = (0.0, None)
+
+
+def _comports():
+    """(device, description) for each serial port, rescanned at most every _COMPORTS_TTL s."""
+    global _comports_cache
+    now = time.monotonic()
+    ts, ports = _comports_cache
+    if ports is None or now - ts >= _COMPORTS_TTL:
+        _load_serial_modules()
+        ports = [(p.device or "", p.description or "") for p in list_ports.comports()]
+        _comports_cache = (now, ports)
+    return ports
+
+
 def detect_arduino_port():
-    candidates = []
-    for p in list_ports.comports():
-        dev = p.device or ""
-        desc = (p.description or "").lower()
-        if any(tag in desc for tag in ["arduino", "ch340", "wchusbserial", "usb serial", "usb-serial", "cp210", "ftdi"]) or \
-           any(tag in dev for tag in ["/dev/ttyUSB", "/dev/ttyACM", "/dev/tty.usb", "/dev/tty.SLAB_USB", "/dev/tty.wchusbserial"]):
-            candidates.append(dev)
-        elif dev.startswith("/dev/tty") and ("usb" in dev.lower() or "ACM" in dev or "SLAB" in dev):
-            candidates.append(dev)
-    return candidates[0] if candidates else None
+    for dev, desc in _comports():
+        if _ARDUINO_DESC_RE.search(desc) or _ARDUINO_DEV_RE.search(dev):
+            return dev
+    return None
+
+
+def _serial_set_low_latency(port):
+    """Best-effort ASYNC_LOW_LATENCY on Linux USB-serial bridges (FTDI/CH340).
+
+    Without it the kernel's 16 ms latency timer coalesces incoming bytes.
+    Uses pyserial's set_low_latency_mode (pyserial >= 3.5) and falls back to
+    the TIOCGSERIAL/TIOCSSERIAL ioctl for older versions. Errors are ignored;
+    not all drivers or platforms support it.
+    """
+    try:
+        port.set_low_latency_mode(True)
+        return True
+    except AttributeError:
+        pass
+    except Exception:
+        return False
+    try:
+        import array
+        import fcntl
+        import termios
+        buf = array.array('i', [0] * 32)
+        fcntl.ioctl(port.fileno(), termios.TIOCGSERIAL, buf)
+        buf[4] |= 0x2000  # flags |= ASYNC_LOW_LATENCY
+        fcntl.ioctl(port.fileno(), termios.TIOCSSERIAL, buf)
+        return True
+    except Exception:
+        return False
+
+
+def _serial_close(port):
+    """Close a serial port, first waking any reader blocked in its read().
+
+    Ports are opened without a read timeout, and pyserial's close() alone
+    doesn't interrupt a pending read(); cancel_read() does.
+    """
+    try:
+        port.cancel_read()
+    except Exception:
+        pass
+    try:
+        port.close()
+    except Exception:
+        pass
 
 
 def _serial_try_connect():
@@ -531,7 +1108,11 @@ def _serial_try_connect():
     try:
         port = _serial_port_name or detect_arduino_port()
         if port:
-            ser = serial.Serial(port, BAUD_RATE, timeout=0.1)
+            _load_serial_modules()
+            # No read timeout: _serial_reader blocks until bytes arrive
+            # instead of waking up 10x a second
+            ser = serial.Serial(port, BAUD_RATE, timeout=None, write_timeout=0.1)
+            _serial_set_low_latency(ser)
             _serial_port_name = port
             print(f"Connected to Arduino on {port}")
             return True
@@ -540,11 +1121,8 @@ def _serial_try_connect():
             return False
     except Exception as e:
         print(f"Could not connect to Arduino: {e}")
-        try:
-            if ser:
-                ser.close()
-        except Exception:
-            pass
+        if ser:
+            _serial_close(ser)
         ser = None
         return False
 
@@ -623,9 +1201,36 @@ class ChannelSwitcherApp:
 
         self.rects = []
         self.texts = []
+        self._last_tiles = None  # (PRG, CUE, play arm) last drawn
+        self._status_pending = False
+        self._last_status = (None, None, None, None)
+        # Connection states shown in the status line; kept current by
+        # ensure_connections, the serial reader and the mpv sync tick
+        self._atem_ok = False
+        self._arduino_ok = False
+        self._mpv_ok = False
+        # Constant parts of the status label texts
+        self._atem_prefix = f"ATEM ({ATEM_IP}): "
+        self._mpv_prefix = f"MPV ({MPV_SOCKET}): "
+        self._build_rects()
         self.draw_rects()
         self.update_status_labels()
 
+        # on_key dispatch: by event.char first, then by event.keysym
+        self._char_actions = {
+            '1': functools.partial(self._key_cue, 1),
+            '2': functools.partial(self._key_cue, 2),
+            '0': self._key_blackout,
+            'p': self._key_play_arm,
+            'P': self._key_play_arm,
+            'l': self._key_reload,
+            'L': self._key_reload,
+        }
+        self._keysym_actions = {
+            'space': self._key_cut,
+            'Left': functools.partial(self._key_seek, -1),
+            'Right': functools.partial(self._key_seek, 1),
+        }
         for key in ['1', '2', '0', 'p', 'P', 'l', 'L']:
             self.root.bind(key, self.on_key)
         self.root.bind('<space>', self.on_key)
@@ -635,21 +1240,18 @@ class ChannelSwitcherApp:
 
         self.atem_backoff = 1.0
         self.atem_backoff_max = 10.0
+        self._atem_connecting = False  # a connect thread is in flight
         self.serial_backoff = 1.0
         self.serial_backoff_max = 10.0
 
-        # Ensure mpv is running and IPC is ready; then preload video (if configured)
-        launch_mpv_if_needed()
+        # Ensure mpv is running and IPC is ready, then preload video (if
+        # configured) -- in the background, as launching can take seconds.
         self._mpv_loaded = False
-        if VIDEO_FILE:
-            if os.path.isfile(VIDEO_FILE):
-                ok = mpv_load_and_pause(VIDEO_FILE)
-                self._mpv_loaded = ok
-            else:
-                print(f"VIDEO_FILE not found: {VIDEO_FILE}")
+        self._mpv_loaded_lock = threading.Lock()
+        threading.Thread(target=self._mpv_bringup, daemon=True).start()
 
+        threading.Thread(target=_load_serial_modules, daemon=True).start()
         self.ensure_connections()
-        self.poll_serial()
         self.start_mpv_sync()   # <<< start preview sync loop
 
         # Glossary/help at bottom
@@ -668,59 +1270,53 @@ class ChannelSwitcherApp:
         self.glossary_lbl.pack(fill='x')
 
 
-    def draw_rects(self):
-        self.canvas.delete("all")
+    def _mpv_bringup(self):
+        """Launch mpv if needed and preload VIDEO_FILE (runs on a worker thread)."""
+        self._mpv_ok = bool(launch_mpv_if_needed())
+        if VIDEO_FILE:
+            if os.path.isfile(VIDEO_FILE):
+                with self._mpv_loaded_lock:
+                    if not self._mpv_loaded:
+                        self._mpv_loaded = mpv_load_and_pause(VIDEO_FILE)
+            else:
+                print(f"VIDEO_FILE not found: {VIDEO_FILE}")
+        self.root.after(0, self.update_status_labels)
+
+    # Tile order on the canvas: LIVE, RECORDED, then the small BLK tile
+    _TILES = (1, 2, 0)
+    _TILE_LABELS = {1: "LIVE", 2: "RECORDED", 0: "BLK"}
+
+    def _build_rects(self):
+        """Create the LIVE/RECORDED/BLK tiles, their labels and the hint line."""
         start_x, start_y = 20, 20
         rect_w, rect_h, gap = 240, 100, 20
 
         for i in range(1, 3):
-            fill = 'red' if i == self.PRG else 'white'
-            width = 3
-            outline_color = 'black'
-            if i == self.CUE and self.CUE != self.PRG:
-                outline_color = 'green'
-                width = 7
             rect_id = self.canvas.create_rectangle(
                 start_x, start_y,
                 start_x + rect_w, start_y + rect_h,
-                fill=fill, outline=outline_color, width=width
+                fill='white', outline='black', width=3
             )
-            if i == 1:
-                text = "LIVE"
-            elif i == 2:
-                text = "RECORDED"
-            if self.play_on_next_trigger and i == self.CUE:
-                text += " ▶"
             text_id = self.canvas.create_text(
                 start_x + rect_w / 2,
                 start_y + rect_h / 2,
-                text=text, font=('Helvetica', 20, 'bold')
+                text=self._TILE_LABELS[i], font=('Helvetica', 20, 'bold')
             )
             self.rects.append(rect_id)
             self.texts.append(text_id)
             start_x += rect_w + gap
 
         # Add blackout (0) indicator tile: small and black background
-        i = 0
-        fill = 'red' if i == self.PRG else 'black'
-        width = 3
-        outline_color = 'black'
-        if i == self.CUE and self.CUE != self.PRG:
-            outline_color = 'green'
-            width = 7
         small_w, small_h = 70, 60
         rect_id = self.canvas.create_rectangle(
             start_x, start_y + (rect_h - small_h) / 2,
             start_x + small_w, start_y + (rect_h - small_h) / 2 + small_h,
-            fill=fill, outline=outline_color, width=width
+            fill='black', outline='black', width=3
         )
-        text = "BLK"
-        if self.play_on_next_trigger and i == self.CUE:
-            text += " ▶"
         text_id = self.canvas.create_text(
             start_x + small_w / 2,
             start_y + rect_h / 2,
-            text=text, font=('Helvetica', 16, 'bold'), fill='white' if fill == 'black' else 'black'
+            text=self._TILE_LABELS[0], font=('Helvetica', 16, 'bold'), fill='white'
         )
         self.rects.append(rect_id)
         self.texts.append(text_id)
@@ -732,21 +1328,57 @@ class ChannelSwitcherApp:
             font=('Helvetica', 11)
         )
 
+    def draw_rects(self):
+        """Restyle the tiles in place with current PRG/CUE/play-arm state."""
+        state = (self.PRG, self.CUE, self.play_on_next_trigger)
+        if state == self._last_tiles:
+            return
+        self._last_tiles = state
+        for rect_id, text_id, i in zip(self.rects, self.texts, self._TILES):
+            if i == self.PRG:
+                fill = 'red'
+            else:
+                fill = 'black' if i == 0 else 'white'
+            width = 3
+            outline_color = 'black'
+            if i == self.CUE and self.CUE != self.PRG:
+                outline_color = 'green'
+                width = 7
+            self.canvas.itemconfigure(rect_id, fill=fill, outline=outline_color, width=width)
+
+            text = self._TILE_LABELS[i]
+            if self.play_on_next_trigger and i == self.CUE:
+                text += " ▶"
+            if i == 0:
+                self.canvas.itemconfigure(text_id, text=text, fill='white' if fill == 'black' else 'black')
+            else:
+                self.canvas.itemconfigure(text_id, text=text)
+
     def trigger(self):
+        """Perform a CUT: set PRG = CUE, send the ATEM commands, then finish.
+
+        The ATEM pacing is staged with root.after() instead of sleeping, so
+        the mainloop keeps handling keys and serial input during the cut.
+        """
         self.PRG = self.CUE
+        if _atem_is_connected():
+            self.root.after(10, self._trigger_cut, self.CUE)
+        else:
+            self.atem_backoff = 1.0
+            self._trigger_finish()
+
+    def _trigger_cut(self, cue):
         try:
-            if _atem_is_connected():
-                time.sleep(0.01)
-                switcher.execCutME(0)                
-                switcher.setPreviewInputVideoSource(0, self.CUE)
-                switcher.setProgramInputVideoSource(0, self.PRG)
-                time.sleep(0.2)
-            else:
-                self.atem_backoff = 1.0
+            sw = _get_switcher()
+            sw.execCutME(0)
+            sw.setPreviewInputVideoSource(0, cue)
+            sw.setProgramInputVideoSource(0, cue)
         except Exception as e:
             print(f"ATEM command error: {e}")
             self.atem_backoff = 1.0
+        self.root.after(200, self._trigger_finish)
 
+    def _trigger_finish(self):
         # Update counters on each trigger
         try:
             if getattr(self, 'num_steps', None) is None:
@@ -777,11 +1409,22 @@ class ChannelSwitcherApp:
                 mpv_play()
             self.play_on_next_trigger = False
 
-            # Tighten sync immediately on trigger (optional)
+            # Tighten sync immediately on trigger (optional); only seek the
+            # preview when it has actually drifted, as a seek stalls its decoder
             if MPV_PREVIEW_ENABLE and MPV_PREVIEW_SOCKET:
-                t = mpv_get(MPV_SOCKET, "time-pos", None)
+                # Positions come from the observed shadows the sync loop keeps;
+                # ask mpv only if they haven't been reported yet
+                prog = mpv_observed(MPV_SOCKET, _MPV_SYNC_PROPS) or {}
+                t = prog["time-pos"] if "time-pos" in prog else mpv_get(MPV_SOCKET, "time-pos", None)
                 if t is not None:
-                    mpv_set(MPV_PREVIEW_SOCKET, "time-pos", t)
+                    prev = mpv_observed(MPV_PREVIEW_SOCKET, _MPV_SYNC_PROPS) or {}
+                    prev_t = prev["time-pos"] if "time-pos" in prev else mpv_get(MPV_PREVIEW_SOCKET, "time-pos", None)
+                    try:
+                        drifted = prev_t is None or abs(float(t) - float(prev_t)) > MPV_SYNC_DRIFT_SEC
+                    except Exception:
+                        drifted = True
+                    if drifted:
+                        mpv_set(MPV_PREVIEW_SOCKET, "time-pos", t)
 
         self.update_display()
 
@@ -918,7 +1561,8 @@ class ChannelSwitcherApp:
 
         try:
             ok = mpv_load_and_pause(path)
-            self._mpv_loaded = bool(ok)
+            with self._mpv_loaded_lock:
+                self._mpv_loaded = bool(ok)
         except Exception as e:
             print(f'Failed to load video: {e}')
         finally:
@@ -928,218 +1572,348 @@ class ChannelSwitcherApp:
                 pass
 
     def on_key(self, event):
-        if event.char in ['1', '2']:
-            self.CUE = int(event.char)
-            try:
-                if _atem_is_connected():
-                    switcher.setPreviewInputVideoSource(0, self.CUE)
-                else:
-                    self.atem_backoff = 1.0
-            except Exception as e:
-                print(f"ATEM preview set error: {e}")
-                self.atem_backoff = 1.0
-        if event.char == '0':
-            self.CUE = 0
-        elif event.keysym == 'space':
-            self.trigger()
-        elif event.char in ['p', 'P']:
-            # Toggle play-on-next-trigger. When enabling, try to preload once.
-            if self.play_on_next_trigger:
-                # Second press before trigger cancels the arm
-                self.play_on_next_trigger = False
+        action = self._char_actions.get(event.char) or self._keysym_actions.get(event.keysym)
+        # Handlers return True when the tiles need redrawing
+        if action is not None and action():
+            self.update_display()
+
+    def _key_cue(self, cue):
+        self.CUE = cue
+        try:
+            if _atem_is_connected():
+                _get_switcher().setPreviewInputVideoSource(0, self.CUE)
             else:
+                self.atem_backoff = 1.0
+        except Exception as e:
+            print(f"ATEM preview set error: {e}")
+            self.atem_backoff = 1.0
+        return True
+
+    def _key_blackout(self):
+        self.CUE = 0
+        return True
+
+    def _key_cut(self):
+        self.trigger()
+        return True
+
+    def _key_play_arm(self):
+        # Toggle play-on-next-trigger. When enabling, try to preload once.
+        if self.play_on_next_trigger:
+            # Second press before trigger cancels the arm
+            self.play_on_next_trigger = False
+        else:
+            with self._mpv_loaded_lock:
                 if VIDEO_FILE and not self._mpv_loaded and os.path.isfile(VIDEO_FILE):
                     self._mpv_loaded = mpv_load_and_pause(VIDEO_FILE)
-                self.play_on_next_trigger = True
-        elif event.char in ['l', 'L']:
-            # Pause and reload video to start (program and preview)
-            try:
-                if VIDEO_FILE and os.path.isfile(VIDEO_FILE):
-                    ok = mpv_load_and_pause(VIDEO_FILE)
-                    if ok:
+            self.play_on_next_trigger = True
+        return True
+
+    def _key_reload(self):
+        # Pause and reload video to start (program and preview)
+        try:
+            if VIDEO_FILE and os.path.isfile(VIDEO_FILE):
+                ok = mpv_load_and_pause(VIDEO_FILE)
+                if ok:
+                    with self._mpv_loaded_lock:
                         self._mpv_loaded = True
-                else:
-                    # Fallback: just pause and seek to 0 on current file
-                    mpv_set(MPV_SOCKET, "pause", True)
-                    mpv_set(MPV_SOCKET, "time-pos", 0)
-                    if MPV_PREVIEW_ENABLE and MPV_PREVIEW_SOCKET:
-                        mpv_set(MPV_PREVIEW_SOCKET, "pause", True)
-                        mpv_set(MPV_PREVIEW_SOCKET, "time-pos", 0)
-            except Exception as e:
-                print(f"MPV reload error: {e}")
-        elif event.keysym in ['Left', 'Right']:
-            # Pause and seek ±configured ms with immediate preview sync
-            try:
-                # Ensure paused
-                mpv_set(MPV_SOCKET, "pause", True)
-                # Get current time, adjust by 0.1s
-                t = mpv_get(MPV_SOCKET, "time-pos", None)
-                if t is not None:
-                    try:
-                        t = float(t)
-                    except Exception:
-                        t = None
-                if t is not None:
-                    delta = max(0.001, float(self.mpv_seek_step_ms) / 1000.0)
-                    # Clamp to [0, duration]
-                    dur = mpv_get(MPV_SOCKET, "duration", None)
-                    try:
-                        dur = float(dur) if dur is not None else None
-                    except Exception:
-                        dur = None
-                    new_t = (t - delta) if event.keysym == 'Left' else (t + delta)
-                    if new_t < 0.0:
-                        new_t = 0.0
-                    if dur is not None and new_t > dur:
-                        new_t = dur
-                    mpv_set(MPV_SOCKET, "time-pos", new_t)
-                    # Sync preview position while paused
-                    if MPV_PREVIEW_ENABLE and MPV_PREVIEW_SOCKET:
-                        mpv_set(MPV_PREVIEW_SOCKET, "pause", True)
-                        mpv_set(MPV_PREVIEW_SOCKET, "time-pos", new_t)
-            except Exception as e:
-                print(f"MPV seek error: {e}")
-        self.update_display()
+            else:
+                # Fallback: just pause and seek to 0 on current file
+                rewind = [["set_property", "pause", True], ["set_property", "time-pos", 0]]
+                mpv_send_many(rewind, wait=False)
+                if MPV_PREVIEW_ENABLE and MPV_PREVIEW_SOCKET:
+                    mpv_send_many(rewind, MPV_PREVIEW_SOCKET, wait=False)
+        except Exception as e:
+            print(f"MPV reload error: {e}")
+        return False
 
-    
+    def _key_seek(self, direction):
+        # Pause and seek ±configured ms with immediate preview sync
+        try:
+            # Ensure paused, then get current time and duration, in one round trip
+            mpv_set(MPV_SOCKET, "pause", True)
+            t, dur = mpv_get_many(MPV_SOCKET, ("time-pos", "duration")) or (None, None)
+            if t is not None:
+                try:
+                    t = float(t)
+                except Exception:
+                    t = None
+            if t is not None:
+                delta = max(0.001, float(self.mpv_seek_step_ms) / 1000.0)
+                # Clamp to [0, duration]
+                try:
+                    dur = float(dur) if dur is not None else None
+                except Exception:
+                    dur = None
+                new_t = t + direction * delta
+                if new_t < 0.0:
+                    new_t = 0.0
+                if dur is not None and new_t > dur:
+                    new_t = dur
+                mpv_set(MPV_SOCKET, "time-pos", new_t)
+                # Sync preview position while paused
+                if MPV_PREVIEW_ENABLE and MPV_PREVIEW_SOCKET:
+                    mpv_send_many([["set_property", "pause", True], ["set_property", "time-pos", new_t]],
+                                  MPV_PREVIEW_SOCKET, wait=False)
+        except Exception as e:
+            print(f"MPV seek error: {e}")
+        return False
 
     def update_display(self):
         self.draw_rects()
         self.update_status_labels()
 
     def update_status_labels(self):
-        atem_ok = _atem_is_connected()
-        arduino_ok = bool(ser and getattr(ser, 'is_open', False))
-        atem_text = f"ATEM ({ATEM_IP}): {'Connected' if atem_ok else 'Disconnected'}"
+        """Request a status refresh; bursts within 100 ms collapse into one."""
+        if not self._status_pending:
+            self._status_pending = True
+            self.root.after(100, self._flush_status)
+
+    def _flush_status(self):
+        self._status_pending = False
+        self._do_update_status_labels()
+
+    def _do_update_status_labels(self):
+        """Refresh the status labels from the cached connection states (no I/O).
+
+        Labels whose state is unchanged are not touched.
+        """
+        atem_ok = self._atem_ok
+        arduino_ok = self._arduino_ok
+        port_name = (ser.port if (arduino_ok and ser) else None) or _serial_port_name or 'auto'
+        mpv_ok = self._mpv_ok
+        status = (atem_ok, arduino_ok, port_name, mpv_ok)
+        if status == self._last_status:
+            return
+        last_atem_ok, last_arduino_ok, last_port_name, last_mpv_ok = self._last_status
+        self._last_status = status
+
+        if atem_ok != last_atem_ok:
+            atem_text = self._atem_prefix + ('Connected' if atem_ok else 'Disconnected')
+            self.atem_status_lbl.config(text=atem_text, fg=('green' if atem_ok else 'red'))
+        if (arduino_ok, port_name) != (last_arduino_ok, last_port_name):
+            arduino_text = f"Arduino ({port_name}): {'Connected' if arduino_ok else 'Disconnected'}"
+            self.arduino_status_lbl.config(text=arduino_text, fg=('green' if arduino_ok else 'red'))
+        if mpv_ok != last_mpv_ok:
+            mpv_text = self._mpv_prefix + ('Ready' if mpv_ok else 'No IPC')
+            self.mpv_status_lbl.config(text=mpv_text, fg=('green' if mpv_ok else 'red'))
+
+    def _serial_reader(self, port):
+        """Background reader: block in read() and hand '1' triggers to Tk.
+
+        Reads whatever is buffered in one call rather than readline()'s
+        byte-at-a-time loop. Exits on a serial error (clearing ser so
+        ensure_connections reconnects and starts a new reader) or once the
+        port is replaced.
+        """
+        global ser
+        buf = bytearray()
         try:
-            port_name = ser.port if (ser and ser.is_open) else (_serial_port_name or 'auto')
-        except Exception:
-            port_name = _serial_port_name or 'auto'
-        arduino_text = f"Arduino ({port_name}): {'Connected' if arduino_ok else 'Disconnected'}"
+            while port is ser:
+                data = port.read(port.in_waiting or 1)
+                if not data:
+                    continue
+                buf += data
+                while b"\n" in buf:
+                    line, _, buf = buf.partition(b"\n")
+                    if line.strip() == b"1":
+                        # Same handoff to the Tk thread as the other workers
+                        self.root.after(0, self._on_arduino_cut)
+        except Exception as e:
+            if port is ser:
+                print(f"Serial read error: {e}")
+                _serial_close(port)
+                ser = None
+                self._arduino_ok = False
+                self.serial_backoff = 1.0
 
-        # mpv: simple check by trying to get 'pause' property
-        mpv_ok = False
+    def _on_arduino_cut(self, event=None):
+        # Optional delay before triggering, configurable via env/config
         try:
-            resp = mpv_send({"command": ["get_property", "pause"]})
-            mpv_ok = isinstance(resp, dict) and resp.get('error') == 'success'
+            d = max(0, int(ARDUINO_TRIGGER_DELAY_MS))
         except Exception:
-            mpv_ok = False
-        mpv_text = f"MPV ({MPV_SOCKET}): {'Ready' if mpv_ok else 'No IPC'}"
-
-        self.atem_status_lbl.config(text=atem_text, fg=('green' if atem_ok else 'red'))
-        self.arduino_status_lbl.config(text=arduino_text, fg=('green' if arduino_ok else 'red'))
-        self.mpv_status_lbl.config(text=mpv_text, fg=('green' if mpv_ok else 'red'))
-
-    def poll_serial(self):
-        global ser
-        try:
-            if ser and ser.is_open and ser.in_waiting:
-                data = ser.readline().decode('utf-8', errors='ignore').strip()
-                if data == "1":
-                    # Optional delay before triggering, configurable via env/config
-                    try:
-                        d = max(0, int(ARDUINO_TRIGGER_DELAY_MS))
-                    except Exception:
-                        d = 200
-                    if d:
-                        time.sleep(d / 1000.0)
-                    self.trigger()
-        except Exception as e:
-            print(f"Serial read error: {e}")
-            try:
-                if ser:
-                    ser.close()
-            except Exception:
-                pass
-            ser = None
-            self.serial_backoff = 1.0
-        self.root.after(50, self.poll_serial)
+            d = 200
+        if d:
+            # Wait on the Tk timer, not in sleep(), so the UI stays live
+            self.root.after(d, self.trigger)
+        else:
+            self.trigger()
 
     def ensure_connections(self):
-        if not _atem_is_connected():
+        """Start the ATEM and serial reconnect loops and the 1 Hz status refresh.
+
+        Each loop runs on its own Tk timer with its own backoff, so a dead
+        ATEM doesn't slow down Arduino recovery or vice versa.
+        """
+        self._ensure_atem()
+        self._ensure_serial()
+        self._status_tick()
+
+    @staticmethod
+    def _backoff_ms(backoff):
+        # Jitter keeps retries from falling into lockstep
+        return int(max(200, backoff * 1000) * random.uniform(0.8, 1.2))
+
+    def _ensure_atem(self):
+        self._atem_ok = _atem_is_connected()
+        if self._atem_ok:
+            self.atem_backoff = 1.0
+        elif not self._atem_connecting:
+            # At most one connect attempt at a time; a slow waitForConnection()
+            # must not pile up threads queued on _atem_lock.
             def _connect_atem_async():
-                ok = _atem_connect_blocking()
-                if ok:
-                    print("ATEM connected")
-                    try:
-                        switcher.setAudioMixerMasterVolume(0)
-                        switcher.setProgramInputVideoSource(0, self.PRG)
-                        switcher.setPreviewInputVideoSource(0, self.CUE)
-                    except Exception as e:
-                        print(f"ATEM post-connect init error: {e}")
-                    self.atem_backoff = 1.0
-                else:
-                    self.atem_backoff = min(self.atem_backoff * 2.0, self.atem_backoff_max)
+                try:
+                    ok = _atem_connect_blocking()
+                    if ok:
+                        print("ATEM connected")
+                        try:
+                            sw = _get_switcher()
+                            sw.setAudioMixerMasterVolume(0)
+                            sw.setProgramInputVideoSource(0, self.PRG)
+                            sw.setPreviewInputVideoSource(0, self.CUE)
+                        except Exception as e:
+                            print(f"ATEM post-connect init error: {e}")
+                        self.atem_backoff = 1.0
+                    else:
+                        self.atem_backoff = min(self.atem_backoff * 2.0, self.atem_backoff_max)
+                finally:
+                    self._atem_connecting = False
+            self._atem_connecting = True
             threading.Thread(target=_connect_atem_async, daemon=True).start()
-        else:
-            self.atem_backoff = 1.0
+        self.root.after(self._backoff_ms(self.atem_backoff), self._ensure_atem)
 
+    def _ensure_serial(self):
         global ser
+        if list_ports is None:
+            # pyserial still loading in the background; check back shortly
+            self.root.after(50, self._ensure_serial)
+            return
         if not (ser and getattr(ser, 'is_open', False)):
             ok = _serial_try_connect()
             if ok:
                 self.serial_backoff = 1.0
+                threading.Thread(target=self._serial_reader, args=(ser,), daemon=True).start()
             else:
                 self.serial_backoff = min(self.serial_backoff * 2.0, self.serial_backoff_max)
+            self._arduino_ok = ok
         else:
             self.serial_backoff = 1.0
+        self.root.after(self._backoff_ms(self.serial_backoff), self._ensure_serial)
 
-        delay_s = min(self.atem_backoff, self.serial_backoff)
-        delay_ms = int(max(200, delay_s * 1000))
+    def _status_tick(self):
+        if not MPV_SYNC_ENABLE:
+            # No sync tick to piggyback on; use the (TTL-cached) probe
+            self._mpv_ok = mpv_status_ok()
         self.update_status_labels()
-        self.root.after(delay_ms, self.ensure_connections)
+        self.root.after(1000, self._status_tick)
+
     def start_mpv_sync(self):
-        self._sync_job = None
+        self._visible = True
+        self._sync_wake = threading.Event()
         if MPV_SYNC_ENABLE:
-            self._mpv_sync_tick()
+            self.root.bind('<Map>', functools.partial(self._on_visibility, True), add='+')
+            self.root.bind('<Unmap>', functools.partial(self._on_visibility, False), add='+')
+            # Mirror program path/pause/speed changes (cuts, reloads, seeks)
+            # right away instead of at the next tick; time-pos changes every
+            # frame and is left to the regular ticks
+            _mpv_client(MPV_SOCKET).on_change = self._on_program_change
+            threading.Thread(target=self._mpv_sync_loop, daemon=True).start()
+
+    def _on_program_change(self, name):
+        if name != "time-pos":
+            self._sync_wake.set()
+
+    def _on_visibility(self, visible, event):
+        # Child widgets' Map/Unmap events reach the root binding too
+        if event.widget is not self.root or visible == self._visible:
+            return
+        self._visible = visible
+        if visible:
+            # Resume full-rate sync now rather than after the slow interval
+            self._sync_wake.set()
+
+    def _mpv_sync_loop(self):
+        """Preview mirroring, off the Tk thread; only status changes go back to Tk."""
+        # Ticks run on a fixed monotonic grid, so the time a tick itself takes
+        # doesn't stretch the period and add jitter to drift readings
+        deadline = time.monotonic()
+        while True:
+            try:
+                self._mpv_sync_tick()
+            except Exception as e:
+                print(f"mpv sync error: {e}")
+            # only a coarse sync while the window is hidden
+            interval = MPV_SYNC_INTERVAL_MS if self._visible else max(2000, MPV_SYNC_INTERVAL_MS * 8)
+            now = time.monotonic()
+            deadline = max(deadline + interval / 1000.0, now)
+            if self._sync_wake.wait(deadline - now):
+                # Woken early (program changed, window mapped again): restart
+                # the grid from here
+                self._sync_wake.clear()
+                deadline = time.monotonic()
 
     def _mpv_sync_tick(self):
-        try:
-            # Only run if program socket is alive
-            prog_pause = mpv_get(MPV_SOCKET, "pause", None)
-            if prog_pause is None:
-                # program not up; try again later
-                pass
+        # Only run if program socket is alive. Both players push their
+        # property changes, so this just compares local shadows.
+        prog = mpv_observed(MPV_SOCKET, _MPV_SYNC_PROPS) or {}
+        prog_pause = prog.get("pause")
+        # The shadow doubles as the status-line liveness probe
+        mpv_ok = prog_pause is not None
+        if mpv_ok != self._mpv_ok:
+            self._mpv_ok = mpv_ok
+            self.root.after(0, self.update_status_labels)
+        if prog_pause is None:
+            # program not up; try again later
+            pass
+        elif MPV_PREVIEW_ENABLE and MPV_PREVIEW_SOCKET:
+            prog_path, prog_speed, prog_t = prog.get("path"), prog.get("speed"), prog.get("time-pos")
+            prev = mpv_observed(MPV_PREVIEW_SOCKET, _MPV_SYNC_PROPS) or {}
+            prev_path, prev_pause, prev_speed, prev_t = (
+                prev.get("path") or "", prev.get("pause"), prev.get("speed"), prev.get("time-pos"))
+            fixes = []
+            # Mirror file path
+            if prog_path and prog_path != (prev_path or ""):
+                if not _preview_load_in_flight(prog_path):
+                    fixes.append(["loadfile", prog_path, "replace"])
+                    # ensure muted + paused state mirrors right away
+                    fixes.append(["set_property", "pause", prog_pause])
+                    fixes.append(["set_property", "mute", True])
             else:
-                # Mirror file path
-                prog_path = mpv_get(MPV_SOCKET, "path", "")
-                if MPV_PREVIEW_ENABLE and MPV_PREVIEW_SOCKET:
-                    prev_path = mpv_get(MPV_PREVIEW_SOCKET, "path", "")
-                    if prog_path and prog_path != prev_path:
-                        mpv_send_to(MPV_PREVIEW_SOCKET, {"command": ["loadfile", prog_path, "replace"]})
-                        # ensure muted + paused state mirrors right away
-                        mpv_set(MPV_PREVIEW_SOCKET, "pause", prog_pause)
-                        mpv_set(MPV_PREVIEW_SOCKET, "mute", True)
-
-                    # Mirror pause + speed
-                    prev_pause = mpv_get(MPV_PREVIEW_SOCKET, "pause", None)
-                    if prev_pause is not None and prev_pause != prog_pause:
-                        mpv_set(MPV_PREVIEW_SOCKET, "pause", prog_pause)
-
-                    prog_speed = mpv_get(MPV_SOCKET, "speed", 1.0)
-                    prev_speed = mpv_get(MPV_PREVIEW_SOCKET, "speed", 1.0)
-                    if abs(float(prev_speed) - float(prog_speed)) > 1e-3:
-                        mpv_set(MPV_PREVIEW_SOCKET, "speed", prog_speed)
-
-                    # Time sync (nudge preview when drift exceeds threshold)
-                    prog_t = mpv_get(MPV_SOCKET, "time-pos", None)
-                    prev_t = mpv_get(MPV_PREVIEW_SOCKET, "time-pos", None)
-                    if prog_t is not None and prev_t is not None:
-                        try:
-                            drift = float(prog_t) - float(prev_t)
-                            if abs(drift) > MPV_SYNC_DRIFT_SEC:
-                                mpv_set(MPV_PREVIEW_SOCKET, "time-pos", prog_t)
-                        except Exception:
-                            pass
-        finally:
-            # schedule next tick
-            self._sync_job = self.root.after(MPV_SYNC_INTERVAL_MS, self._mpv_sync_tick)
+                # Mirror pause
+                if prev_pause is not None and prev_pause != prog_pause:
+                    fixes.append(["set_property", "pause", prog_pause])
+                if prog_speed is None:
+                    prog_speed = 1.0
+                if prev_speed is None:
+                    prev_speed = 1.0
+                prog_speed = float(prog_speed)
+                target_speed = prog_speed
+
+                # Time sync: seek on large drift (or any drift while
+                # paused), otherwise nudge the preview speed so it
+                # catches up without a decoder flush
+                if prog_t is not None and prev_t is not None:
+                    try:
+                        drift = float(prog_t) - float(prev_t)
+                    except Exception:
+                        drift = 0.0
+                    if abs(drift) > MPV_SYNC_SEEK_SEC or (prog_pause and abs(drift) > MPV_SYNC_DRIFT_SEC):
+                        fixes.append(["set_property", "time-pos", prog_t])
+                    elif not prog_pause and abs(drift) > MPV_SYNC_DRIFT_SEC:
+                        nudge = max(-MPV_SYNC_MAX_NUDGE, min(MPV_SYNC_MAX_NUDGE, MPV_SYNC_NUDGE_GAIN * drift))
+                        target_speed = prog_speed * (1.0 + nudge)
+                if abs(float(prev_speed) - target_speed) > 1e-3:
+                    fixes.append(["set_property", "speed", target_speed])
+            if fixes and mpv_send_many(fixes, MPV_PREVIEW_SOCKET, wait=False):
+                if fixes[0][0] == "loadfile":
+                    # Hold off re-sending only once the loadfile really went out
+                    _preview_load_sent(prog_path)
 
 
 def main():
     if _atem_is_connected():
         try:
-            switcher.setProgramInputVideoSource(0, 1)
+            _get_switcher().setProgramInputVideoSource(0, 1)
         except Exception as e:
             print(f"ATEM initial program set error: {e}")
     root = tk.Tk()
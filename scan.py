@@ -4,39 +4,106 @@
 ATEM network scanner (PyATEMMax demo)
 
 Description
-- Scans an IPv4 /24 range for reachable ATEM switchers using PyATEMMax ping.
+- Scans an IPv4 /24 range for reachable ATEM switchers. By default one UDP
+  socket sends the ATEM hello packet to every host and collects the replies;
+  --deep does a full PyATEMMax ping/handshake per host instead.
 
 Usage
-- python3 karel/scan.py 192.168.10
-  (scans 192.168.10.1 .. 192.168.10.254)
+- python3 karel/scan.py 192.168.10 [--timeout SECONDS]
+- python3 karel/scan.py 192.168.10 --deep [--workers 64] [--timeout SECONDS]
+  (scans 192.168.10.1 .. 192.168.10.254, many hosts in parallel)
 
 Notes
 - Requires network access; results depend on firewall and switcher settings.
 """
 
 import argparse
+import socket
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import PyATEMMax
 
+# The handshake opener PyATEMMax sends: hello flag, 20-byte length, session 0
+ATEM_HELLO = bytes([0x10, 0x14, 0, 0, 0, 0, 0, 0, 0, 0x3a, 0, 0, 0x01, 0, 0, 0, 0, 0, 0, 0])
+ATEM_PORT = 9910
+
 print(f"[{time.ctime()}] PyATEMMax demo script: scan")
 
 parser = argparse.ArgumentParser()
 parser.add_argument('range', help='IP address range (e.g) 192.168.1')
+parser.add_argument('--deep', action='store_true', help='full PyATEMMax handshake per host')
+parser.add_argument('--workers', type=int, default=64, help='hosts probed in parallel with --deep (default 64)')
+parser.add_argument('--timeout', type=float, default=0.0,
+                    help='seconds to wait for replies (default: 0.5, or the PyATEMMax handshake timeout with --deep)')
 args = parser.parse_args()
 
 print(f"[{time.ctime()}] Scanning network range {args.range}.* for ATEM switchers")
 
-switcher = PyATEMMax.ATEMMax()
-count = 0
 
-for i in range(1,255):
-    ip = f"{args.range}.{i}"
-    print(f"[{time.ctime()}] Checking {ip}", end="\r")
+def probe(ip):
+    # One ATEMMax per host: an instance only tracks a single connection
+    switcher = PyATEMMax.ATEMMax()
+    try:
+        switcher.ping(ip)
+        return switcher.waitForConnection(timeout=args.timeout)
+    finally:
+        switcher.disconnect()
+
+
+def deep_scan(ips):
+    found = []
+    with ThreadPoolExecutor(max_workers=max(1, args.workers)) as pool:
+        futures = {pool.submit(probe, ip): ip for ip in ips}
+        for done, fut in enumerate(as_completed(futures), 1):
+            ip = futures[fut]
+            # Progress line every 10 hosts, not every host
+            if done % 10 == 0 or done == len(ips):
+                print(f"[{time.ctime()}] Checked {done}/{len(ips)}", end="\r", flush=True)
+            try:
+                if fut.result():
+                    found.append(ip)
+            except Exception as e:
+                print(f"[{time.ctime()}] Error checking {ip}: {e}")
+    return found
+
+
+def hello_scan(ips, timeout):
+    """Send a hello to every host from one socket; return the IPs that answer one."""
+    targets = set(ips)
+    found = []
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        for ip in ips:
+            try:
+                sock.sendto(ATEM_HELLO, (ip, ATEM_PORT))
+            except OSError as e:
+                print(f"[{time.ctime()}] Error checking {ip}: {e}")
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            sock.settimeout(remaining)
+            try:
+                data, (ip, _) = sock.recvfrom(2048)
+            except socket.timeout:
+                break
+            except OSError:
+                # e.g. an ICMP port-unreachable surfacing as ECONNREFUSED
+                continue
+            # A switcher answers with the hello flag set in its header
+            if ip in targets and ip not in found and len(data) >= 12 and data[0] & 0x10:
+                found.append(ip)
+    return found
+
 
-    switcher.ping(ip)
-    if switcher.waitForConnection():
-        print(f"[{time.ctime()}] ATEM switcher found at {ip}")
-        count += 1
-    switcher.disconnect()
+ips = [f"{args.range}.{i}" for i in range(1, 255)]
+if args.deep:
+    hits = deep_scan(ips)
+else:
+    hits = hello_scan(ips, args.timeout or 0.5)
 
-print(f"[{time.ctime()}] FINISHED: {count} ATEM switchers found.")
+# Report once the scan is done, in address order
+hits.sort(key=lambda ip: int(ip.rsplit(".", 1)[1]))
+now = time.ctime()
+print("".join(f"[{now}] ATEM switcher found at {ip}\n" for ip in hits)
+      + f"[{now}] FINISHED: {len(hits)} ATEM switchers found.")
@@ -1,36 +1,134 @@
 import socket
 import json
 import os
-import time
 import sys
 import termios
 import tty
 import select
 
+# mpv IPC encoding: use orjson (bytes in/out, C-accelerated) when installed
+try:
+    import orjson
+
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj):
+        return json.dumps(obj).encode('utf-8')
+
+    _json_loads = json.loads
+
 MPV_SOCKET = "/tmp/mpvsocket"
 LIVE_INPUT = "./test1.mp4"
 VIDEO_FILE = "./test2.mp4"
 
-def send_command(command):
-    if not os.path.exists(MPV_SOCKET):
-        print("Error: mpv socket not found!")
-        return
+# Persistent IPC connections keyed by socket path, and the unread bytes for each.
+# mpv also pushes {"event": ...} lines on every connection; those are skipped.
+_MPV_CONN = {}
+_MPV_RBUF = {}
+
+def _mpv_connect(path):
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    # macOS defaults AF_UNIX buffers to 8 KiB; mpv only speaks SOCK_STREAM
+    for opt in (socket.SO_SNDBUF, socket.SO_RCVBUF):
+        if sock.getsockopt(socket.SOL_SOCKET, opt) < 65536:
+            sock.setsockopt(socket.SOL_SOCKET, opt, 65536)
+    sock.settimeout(1.0)
     try:
-        client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-        client.connect(MPV_SOCKET)
-        client.send((json.dumps(command) + '\n').encode('utf-8'))
-        response = client.recv(4096)
-        client.close()
-        return json.loads(response.decode('utf-8'))
+        sock.connect(path)
+    except Exception:
+        sock.close()
+        raise
+    _MPV_CONN[path] = sock
+    _MPV_RBUF[path] = b''
+    return sock
+
+def _mpv_drop(path):
+    sock = _MPV_CONN.pop(path, None)
+    _MPV_RBUF.pop(path, None)
+    if sock is not None:
+        try:
+            sock.close()
+        except Exception:
+            pass
+
+def _mpv_read_reply(path, sock):
+    buf = _MPV_RBUF[path]
+    while True:
+        while b'\n' in buf:
+            line, _, buf = buf.partition(b'\n')
+            if not line.strip():
+                continue
+            resp = _json_loads(line)
+            if isinstance(resp, dict) and 'event' in resp:
+                continue
+            _MPV_RBUF[path] = buf
+            return resp
+        data = sock.recv(4096)
+        if not data:
+            raise ConnectionResetError("mpv closed the IPC connection")
+        buf += data
+
+def send_command(command, path=MPV_SOCKET):
+    return _send_raw(_json_dumps(command) + b'\n', path)
+
+def _send_raw(msg, path=MPV_SOCKET):
+    """Write one encoded, newline-terminated command and return mpv's reply."""
+    for attempt in (1, 2):
+        try:
+            sock = _MPV_CONN.get(path) or _mpv_connect(path)
+            sock.sendall(msg)
+            break
+        except (FileNotFoundError, ConnectionRefusedError):
+            # Only connect() raises these: mpv isn't running
+            _mpv_drop(path)
+            print("Error: mpv socket not found!")
+            return
+        except (BrokenPipeError, ConnectionResetError) as e:
+            # mpv restarted since the last command; reconnect once
+            _mpv_drop(path)
+            if attempt == 2:
+                print("Socket error:", e)
+                return
+        except Exception as e:
+            _mpv_drop(path)
+            print("Socket error:", e)
+            return
+    try:
+        return _mpv_read_reply(path, sock)
     except Exception as e:
+        # The command went out and may have run (e.g. cycle pause), so
+        # it is not resent
+        _mpv_drop(path)
         print("Socket error:", e)
 
-def key_pressed():
-    dr, dw, de = select.select([sys.stdin], [], [], 0)
+# poll() avoids rebuilding fd_sets on every call; macOS poll() doesn't
+# support ttys though, so select() stays as the fallback there. Created on
+# first use, so importing this module never touches stdin.
+_USE_POLL = hasattr(select, "poll") and sys.platform != "darwin"
+_poller = None
+
+def key_pressed(timeout=0):
+    """True once stdin is readable; waits up to timeout seconds (None = forever)."""
+    global _poller
+    if _USE_POLL and _poller is None:
+        _poller = select.poll()
+        _poller.register(sys.stdin.fileno(), select.POLLIN)
+    if _poller is not None:
+        return bool(_poller.poll(None if timeout is None else int(timeout * 1000)))
+    dr, dw, de = select.select([sys.stdin], [], [], timeout)
     return dr != []
 
 def getch():
-    return sys.stdin.read(1)
+    """Read one byte from stdin; None at EOF.
+
+    Unbuffered, so nothing sits in sys.stdin's buffer unseen by poll().
+    Bytes of a multi-byte key come back as '' and match no command.
+    """
+    data = os.read(sys.stdin.fileno(), 1)
+    if not data:
+        return None
+    return data.decode(errors="ignore")
 
 def toggle_pause():
     return send_command({"command": ["cycle", "pause"]})
@@ -38,17 +136,22 @@ def toggle_pause():
 def restart_file():
     return send_command({"command": ["seek", 0, "absolute", "exact"]})
 
+def _blend_payload(expr):
+    return _json_dumps({
+        "command": ["set_property", "vf", "lavfi=[vid1]scale=1280:720[main];[vid0]scale=1280:720[live];[main][live]blend=all_expr='%s'[out]" % expr]
+    }) + b'\n'
+
+# The two switch commands never change; encode them once
+_PAYLOAD_VIDEO = _blend_payload('A')
+_PAYLOAD_LIVE = _blend_payload('B')
+
 def switch_to_video_file():
     print("Switching to video file (blend A)...")
-    return send_command({
-        "command": ["set_property", "vf", "lavfi=[vid1]scale=1280:720[main];[vid0]scale=1280:720[live];[main][live]blend=all_expr='A'[out]"]
-    })
+    return _send_raw(_PAYLOAD_VIDEO)
 
 def switch_to_live_input():
     print("Switching to live input (blend B)...")
-    return send_command({
-        "command": ["set_property", "vf", "lavfi=[vid1]scale=1280:720[main];[vid0]scale=1280:720[live];[main][live]blend=all_expr='B'[out]"]
-    })
+    return _send_raw(_PAYLOAD_LIVE)
 
 def main():
     fd = sys.stdin.fileno()
@@ -64,8 +167,12 @@ def main():
 
     try:
         while True:
-            if key_pressed():
+            # Sleep in the kernel until a key arrives
+            if key_pressed(None):
                 ch = getch()
+                if ch is None:
+                    # stdin closed
+                    break
 
                 if ch == '1':
                     switch_to_live_input()
@@ -79,8 +186,6 @@ def main():
                     print("Quitting...")
                     break
 
-            time.sleep(0.1)
-
     finally:
         termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
 
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Freeze .env + config.json into _config_generated.py
+
+Description
+- Resolves the same .env and config.json files run_mpv.py would use from the
+  current directory and writes their values as Python literals to
+  _config_generated.py next to run_mpv.py.
+- run_mpv.py imports that module at startup instead of parsing the files,
+  and falls back to parsing whenever a source file changed, appeared or
+  disappeared since it was generated.
+
+Usage
+- python3 tools/freeze_config.py   (run from the directory you start the app in)
+- Re-run after editing .env or config.json; a stale module is simply ignored.
+"""
+
+import os
+import pprint
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Never read a previous freeze while producing a new one
+sys.modules['_config_generated'] = None
+
+import run_mpv  # noqa: E402
+
+
+def main():
+    env_paths = run_mpv._env_candidate_paths()
+    env_path = next((p for p in env_paths if os.path.isfile(p)), None)
+    env = run_mpv._parse_env_file(env_path) if env_path else {}
+
+    # run_mpv already applied the .env, so KAREL_CONFIG is resolved as at startup
+    conf_paths = run_mpv._config_paths()
+    conf = run_mpv.load_config()
+
+    out_path = os.path.join(os.path.dirname(os.path.abspath(run_mpv.__file__)), "_config_generated.py")
+    body = (
+        "# Generated by tools/freeze_config.py -- do not edit.\n"
+        "# Ignored by run_mpv.py when any source below has changed.\n\n"
+        f"ENV_SOURCES = {pprint.pformat(run_mpv._source_stamps(env_paths))}\n\n"
+        f"ENV = {pprint.pformat(env)}\n\n"
+        f"CONFIG_SOURCES = {pprint.pformat(run_mpv._source_stamps(conf_paths))}\n\n"
+        f"CONFIG = {pprint.pformat(conf)}\n"
+    )
+    tmp_path = out_path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(body)
+    os.replace(tmp_path, out_path)
+    print(f"Wrote {out_path}")
+
+
+if __name__ == "__main__":
+    main()